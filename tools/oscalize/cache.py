@@ -0,0 +1,16 @@
+"""
+Per-user cache location for oscalize
+
+Holds data that is expensive to rebuild but safe to discard, such as generated
+CIR schema validator code and the detected oscal-cli version.
+"""
+
+import os
+from pathlib import Path
+
+
+def cache_dir() -> Path:
+    """Return the oscalize cache directory, honouring XDG_CACHE_HOME"""
+    cache_home = os.environ.get("XDG_CACHE_HOME")
+    base = Path(cache_home) if cache_home else Path.home() / ".cache"
+    return base / "oscalize"
@@ -4,24 +4,135 @@ CIR data processor
 Processes and normalizes CIR data structures for consistency and optimization.
 """
 
+import ipaddress
 import logging
 import re
-from typing import Any, Dict, List, Optional
+import sys
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
+_WS_RE = re.compile(r'\s+')
+_NONPRINT_RE = re.compile(r'[^\x20-\x7E\n\t]')
+_ASSET_CLEAN_RE = re.compile(r'[^\w\-]')
+_HYPHEN_COLLAPSE_RE = re.compile(r'-+')
+
+# Deletion table equivalent to _NONPRINT_RE for ASCII-only text
+_ASCII_NONPRINT_TABLE = {
+    code: None for code in range(128)
+    if not (0x20 <= code <= 0x7E or chr(code) in '\n\t')
+}
+
+# Dotted-quad IPv4 with octets 0-255 and no leading zeros, as accepted by ipaddress
+_IPV4_OCTET = r'(?:25[0-5]|2[0-4][0-9]|1[0-9][0-9]|[1-9]?[0-9])'
+_IPV4_RE = re.compile(rf'{_IPV4_OCTET}(?:\.{_IPV4_OCTET}){{3}}')
+
+_CONTROL_ID_PATTERNS = (
+    r'\b[A-Z]{2}-\d+(?:\(\d+\))?\b',  # AC-1, AC-2(1), etc.
+    r'\b[A-Z]{2}\.\d+\b'              # AC.1, AC.2, etc.
+)
+_CONTROL_ID_RES = tuple(re.compile(p) for p in _CONTROL_ID_PATTERNS)
+_CONTROL_ID_COMBINED_RE = re.compile('|'.join(f'(?:{p})' for p in _CONTROL_ID_PATTERNS))
+
+# Base risk score by POA&M severity
+_SEVERITY_SCORES = {
+    "Critical": 10,
+    "High": 7,
+    "Moderate": 4,
+    "Low": 1
+}
+
+# Risk score adjustment by POA&M status
+_STATUS_MULTIPLIERS = {
+    "Open": 1.0,
+    "Ongoing": 0.7,
+    "Risk Accepted": 0.3,
+    "Completed": 0.1
+}
+
+_RISK_SCORES = {
+    (severity, status): int(base_score * multiplier)
+    for severity, base_score in _SEVERITY_SCORES.items()
+    for status, multiplier in _STATUS_MULTIPLIERS.items()
+}
+
+_HIGH_CRITICALITY = frozenset({"Critical", "High"})
+
+
+def _normalize_string(text: str) -> str:
+    """Collapse whitespace and drop non-printable characters from text"""
+    if not text:
+        return ""
+    
+    # Strip and replace multiple whitespace with single space
+    normalized = _WS_RE.sub(' ', text.strip())
+    
+    # Remove non-printable characters except newlines and tabs; most text is
+    # already printable ASCII, which two C-level checks detect without a regex pass
+    if normalized.isascii():
+        if normalized.isprintable():
+            return normalized
+        # Stray control characters in ASCII text; translate drops them in one C pass
+        return normalized.translate(_ASCII_NONPRINT_TABLE)
+    
+    return _NONPRINT_RE.sub('', normalized)
+
+
+@lru_cache(maxsize=4096)
+def _normalize_control_id_cached(control_id: str) -> Tuple[str, bool]:
+    """Uppercase a control ID and report whether it matches a known format"""
+    normalized = control_id.strip().upper()
+    
+    for pattern in _CONTROL_ID_RES:
+        if pattern.match(normalized):
+            return normalized, True
+    
+    return normalized, False
+
+
+# Shared by POA&M rows and inventory assets, which reference the same IDs
+@lru_cache(maxsize=4096)
+def _normalize_asset_id_cached(asset_id: str) -> str:
+    """Lowercase an asset ID and collapse special characters into hyphens"""
+    # Remove whitespace and convert to lowercase
+    normalized = asset_id.strip().lower()
+    
+    # Replace spaces and special characters with hyphens
+    normalized = _ASSET_CLEAN_RE.sub('-', normalized)
+    
+    # Remove multiple consecutive hyphens
+    normalized = _HYPHEN_COLLAPSE_RE.sub('-', normalized)
+    
+    # Remove leading/trailing hyphens; interning makes spellings that normalize
+    # alike share one string object
+    return sys.intern(normalized.strip('-'))
+
+
+@lru_cache(maxsize=2048)
+def _is_valid_ip_address(ip_str: str) -> bool:
+    """Check IP address format, matching common IPv4 addresses without ipaddress"""
+    if isinstance(ip_str, str) and _IPV4_RE.fullmatch(ip_str):
+        return True
+    
+    try:
+        ipaddress.ip_address(ip_str)
+        return True
+    except ValueError:
+        return False
+
 
 class CIRProcessor:
     """Processor for CIR data normalization and enhancement"""
     
     def __init__(self):
-        self.control_id_patterns = [
-            r'\b[A-Z]{2}-\d+(?:\(\d+\))?\b',  # AC-1, AC-2(1), etc.
-            r'\b[A-Z]{2}\.\d+\b'              # AC.1, AC.2, etc.
-        ]
+        self.control_id_patterns = list(_CONTROL_ID_PATTERNS)
     
     def process(self, data: Dict[str, Any], data_type: str) -> Dict[str, Any]:
-        """Process CIR data based on type"""
+        """Process CIR data based on type
+        
+        Normalization is applied in place; the returned dict is ``data`` itself.
+        """
         logger.debug(f"Processing CIR data of type: {data_type}")
         
         if data_type == "document":
@@ -38,220 +149,165 @@ class CIRProcessor:
     
     def _process_document(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """Process document CIR data"""
-        processed_data = data.copy()
-        
-        if "sections" in processed_data:
-            processed_sections = []
-            
-            for section in processed_data["sections"]:
-                processed_section = self._process_section(section)
-                processed_sections.append(processed_section)
-            
-            processed_data["sections"] = processed_sections
-        
-        return processed_data
+        for section in data.get("sections", []):
+            self._process_section(section)
+        
+        return data
     
     def _process_section(self, section: Dict[str, Any]) -> Dict[str, Any]:
         """Process individual document section"""
-        processed_section = section.copy()
-        
         # Normalize section title
-        if "title" in processed_section:
-            processed_section["title"] = self._normalize_text(processed_section["title"])
+        if "title" in section:
+            section["title"] = _normalize_string(section["title"])
         
         # Extract and enhance control references
-        text = processed_section.get("text", "")
+        text = section.get("text", "")
         control_ids = self._extract_control_ids(text)
         if control_ids:
-            processed_section["control_references"] = control_ids
+            section["control_references"] = control_ids
         
         # Process tables
-        if "tables" in processed_section:
-            processed_tables = []
-            for table in processed_section["tables"]:
-                processed_table = self._process_table(table)
-                processed_tables.append(processed_table)
-            processed_section["tables"] = processed_tables
-        
-        return processed_section
+        for table in section.get("tables", []):
+            self._process_table(table)
+        
+        return section
     
     def _process_table(self, table: Dict[str, Any]) -> Dict[str, Any]:
         """Process table data"""
-        processed_table = table.copy()
+        # Bind the normalizer locally for the per-cell loops
+        normalize = _normalize_string
         
         # Normalize headers
-        if "headers" in processed_table:
-            processed_table["headers"] = [
-                self._normalize_text(header) for header in processed_table["headers"]
+        if "headers" in table:
+            table["headers"] = [
+                normalize(header) if header else ""
+                for header in table["headers"]
             ]
         
-        # Normalize cell data
-        if "rows" in processed_table:
-            processed_rows = []
-            for row in processed_table["rows"]:
-                processed_row = [self._normalize_text(cell) for cell in row]
-                processed_rows.append(processed_row)
-            processed_table["rows"] = processed_rows
+        # Normalize cell data, skipping the many blank cells typical of SSP tables
+        if "rows" in table:
+            table["rows"] = [
+                [normalize(cell) if cell else "" for cell in row]
+                for row in table["rows"]
+            ]
         
-        return processed_table
+        return table
     
     def _process_poam(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """Process POA&M CIR data"""
-        processed_data = data.copy()
-        
-        if "rows" in processed_data:
-            processed_rows = []
-            
-            for row in processed_data["rows"]:
-                processed_row = self._process_poam_row(row)
-                processed_rows.append(processed_row)
-            
-            processed_data["rows"] = processed_rows
-        
-        return processed_data
+        process_row = self._process_poam_row
+        for row in data.get("rows", []):
+            process_row(row)
+        
+        return data
     
     def _process_poam_row(self, row: Dict[str, Any]) -> Dict[str, Any]:
         """Process individual POA&M row"""
-        processed_row = row.copy()
-        
         # Normalize text fields
-        text_fields = ["title", "description", "comments"]
-        for field in text_fields:
-            if field in processed_row:
-                processed_row[field] = self._normalize_text(processed_row[field])
+        for field in ("title", "description", "comments"):
+            if field in row:
+                value = row[field]
+                row[field] = _normalize_string(value) if value else ""
         
         # Validate and normalize control IDs
-        if "control_ids" in processed_row:
+        if "control_ids" in row:
+            normalize_control_id = self._normalize_control_id
             normalized_ids = []
-            for control_id in processed_row["control_ids"]:
-                normalized_id = self._normalize_control_id(control_id)
+            for control_id in row["control_ids"]:
+                normalized_id = normalize_control_id(control_id)
                 if normalized_id:
                     normalized_ids.append(normalized_id)
-            processed_row["control_ids"] = normalized_ids
+            row["control_ids"] = normalized_ids
         
         # Normalize asset IDs
-        if "asset_ids" in processed_row:
-            processed_row["asset_ids"] = [
-                self._normalize_asset_id(asset_id) 
-                for asset_id in processed_row["asset_ids"]
+        if "asset_ids" in row:
+            normalize_asset_id = self._normalize_asset_id
+            row["asset_ids"] = [
+                normalize_asset_id(asset_id) 
+                for asset_id in row["asset_ids"]
             ]
         
         # Add derived fields
-        processed_row["risk_score"] = self._calculate_risk_score(processed_row)
+        row["risk_score"] = self._calculate_risk_score(row)
         
-        return processed_row
+        return row
     
     def _process_inventory(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """Process inventory CIR data"""
-        processed_data = data.copy()
-        
-        if "assets" in processed_data:
-            processed_assets = []
-            
-            for asset in processed_data["assets"]:
-                processed_asset = self._process_asset(asset)
-                processed_assets.append(processed_asset)
-            
-            processed_data["assets"] = processed_assets
-        
-        return processed_data
+        process_asset = self._process_asset
+        for asset in data.get("assets", []):
+            process_asset(asset)
+        
+        return data
     
     def _process_asset(self, asset: Dict[str, Any]) -> Dict[str, Any]:
         """Process individual asset"""
-        processed_asset = asset.copy()
-        
         # Normalize text fields
         text_fields = ["name", "description", "asset_owner", "system_admin"]
         for field in text_fields:
-            if field in processed_asset:
-                processed_asset[field] = self._normalize_text(processed_asset[field])
+            if field in asset:
+                asset[field] = _normalize_string(asset[field])
         
         # Normalize asset ID
-        if "asset_id" in processed_asset:
-            processed_asset["asset_id"] = self._normalize_asset_id(processed_asset["asset_id"])
+        if "asset_id" in asset:
+            asset["asset_id"] = self._normalize_asset_id(asset["asset_id"])
         
         # Add computed fields
-        processed_asset["fqdn"] = self._derive_fqdn(processed_asset)
-        processed_asset["risk_category"] = self._categorize_risk(processed_asset)
+        asset["fqdn"] = self._derive_fqdn(asset)
+        asset["risk_category"] = self._categorize_risk(asset)
         
         # Validate IP addresses
-        if "ip_address" in processed_asset:
-            ip_valid = self._validate_ip_address(processed_asset["ip_address"])
-            processed_asset["ip_address_valid"] = ip_valid
+        if "ip_address" in asset:
+            ip_valid = self._validate_ip_address(asset["ip_address"])
+            asset["ip_address_valid"] = ip_valid
         
-        return processed_asset
+        return asset
     
     def _process_controls(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """Process controls CIR data"""
-        processed_data = data.copy()
-        
-        if "controls" in processed_data:
-            processed_controls = []
-            
-            for control in processed_data["controls"]:
-                processed_control = self._process_control(control)
-                processed_controls.append(processed_control)
-            
-            processed_data["controls"] = processed_controls
-        
-        return processed_data
+        process_control = self._process_control
+        for control in data.get("controls", []):
+            process_control(control)
+        
+        return data
     
     def _process_control(self, control: Dict[str, Any]) -> Dict[str, Any]:
         """Process individual control"""
-        processed_control = control.copy()
-        
         # Normalize control ID
-        if "control_id" in processed_control:
-            processed_control["control_id"] = self._normalize_control_id(processed_control["control_id"])
+        if "control_id" in control:
+            control["control_id"] = self._normalize_control_id(control["control_id"])
         
         # Normalize text fields
         text_fields = ["control_title", "control_description", "implementation_guidance", "notes"]
         for field in text_fields:
-            if field in processed_control:
-                processed_control[field] = self._normalize_text(processed_control[field])
+            if field in control:
+                control[field] = _normalize_string(control[field])
         
-        return processed_control
+        return control
     
     # Helper methods
     
     def _normalize_text(self, text: str) -> str:
         """Normalize text content"""
-        if not text:
-            return ""
-        
-        # Strip whitespace
-        normalized = text.strip()
-        
-        # Replace multiple whitespace with single space
-        normalized = re.sub(r'\s+', ' ', normalized)
-        
-        # Remove non-printable characters except newlines and tabs
-        normalized = re.sub(r'[^\x20-\x7E\n\t]', '', normalized)
-        
-        return normalized
+        return _normalize_string(text)
     
     def _extract_control_ids(self, text: str) -> List[str]:
         """Extract NIST control IDs from text"""
-        control_ids = set()
-        
-        for pattern in self.control_id_patterns:
-            matches = re.findall(pattern, text)
-            control_ids.update(matches)
+        # Every control ID format contains a hyphen or a dot; substring checks are
+        # far cheaper than running the regex over narrative-only text
+        if not text or ('-' not in text and '.' not in text):
+            return []
         
-        return sorted(list(control_ids))
+        return sorted(set(_CONTROL_ID_COMBINED_RE.findall(text)))
     
     def _normalize_control_id(self, control_id: str) -> Optional[str]:
         """Normalize control ID format"""
         if not control_id:
             return None
         
-        # Remove whitespace and convert to uppercase
-        normalized = control_id.strip().upper()
-        
-        # Validate format
-        for pattern in self.control_id_patterns:
-            if re.match(pattern, normalized):
-                return normalized
+        normalized, valid = _normalize_control_id_cached(control_id)
+        if valid:
+            return normalized
         
         logger.warning(f"Invalid control ID format: {control_id}")
         return control_id  # Return original if validation fails
@@ -261,46 +317,19 @@ class CIRProcessor:
         if not asset_id:
             return ""
         
-        # Remove whitespace and convert to lowercase
-        normalized = asset_id.strip().lower()
-        
-        # Replace spaces and special characters with hyphens
-        normalized = re.sub(r'[^\w\-]', '-', normalized)
-        
-        # Remove multiple consecutive hyphens
-        normalized = re.sub(r'-+', '-', normalized)
-        
-        # Remove leading/trailing hyphens
-        normalized = normalized.strip('-')
-        
-        return normalized
+        return _normalize_asset_id_cached(asset_id)
     
     def _calculate_risk_score(self, poam_row: Dict[str, Any]) -> int:
         """Calculate numeric risk score from POA&M data"""
         severity = poam_row.get("severity", "Low")
         status = poam_row.get("status", "Open")
         
-        # Base score from severity
-        severity_scores = {
-            "Critical": 10,
-            "High": 7,
-            "Moderate": 4,
-            "Low": 1
-        }
-        
-        base_score = severity_scores.get(severity, 1)
+        score = _RISK_SCORES.get((severity, status))
+        if score is None:
+            # Unknown severity scores 1 and unknown status keeps the full score
+            score = int(_SEVERITY_SCORES.get(severity, 1) * _STATUS_MULTIPLIERS.get(status, 1.0))
         
-        # Adjust for status
-        status_multipliers = {
-            "Open": 1.0,
-            "Ongoing": 0.7,
-            "Risk Accepted": 0.3,
-            "Completed": 0.1
-        }
-        
-        multiplier = status_multipliers.get(status, 1.0)
-        
-        return int(base_score * multiplier)
+        return score
     
     def _derive_fqdn(self, asset: Dict[str, Any]) -> Optional[str]:
         """Derive FQDN from asset data"""
@@ -322,7 +351,7 @@ class CIRProcessor:
         environment = asset.get("environment", "")
         
         # High risk conditions
-        if criticality in ["Critical", "High"]:
+        if criticality in _HIGH_CRITICALITY:
             if public_access or environment == "Production":
                 return "high"
         
@@ -334,10 +363,4 @@ class CIRProcessor:
     
     def _validate_ip_address(self, ip_str: str) -> bool:
         """Validate IP address format"""
-        import ipaddress
-        
-        try:
-            ipaddress.ip_address(ip_str)
-            return True
-        except ValueError:
-            return False
\ No newline at end of file
+        return _is_valid_ip_address(ip_str)
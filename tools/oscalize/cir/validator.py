@@ -4,14 +4,24 @@ CIR validator using JSON schemas
 Validates Canonical Intermediate Representation data against schemas.
 """
 
+import hashlib
 import json
 import logging
+import os
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
 import jsonschema
 from jsonschema import Draft7Validator
 
+try:
+    import fastjsonschema
+except ImportError:
+    fastjsonschema = None
+
+from ..cache import cache_dir
+from ..jsonio import dumps, loads
+
 logger = logging.getLogger(__name__)
 
 
@@ -21,45 +31,152 @@ class CIRValidator:
     def __init__(self, schema_dir: Path):
         self.schema_dir = Path(schema_dir)
         self.schemas = {}
+        self._schema_paths = {}
+        self._validators = {}
+        self._compiled_validators = {}
         self._load_schemas()
     
     def _load_schemas(self) -> None:
-        """Load all CIR schemas from schema directory"""
+        """Locate CIR schemas in schema directory; each is parsed on first use"""
         if not self.schema_dir.exists():
             logger.warning(f"Schema directory not found: {self.schema_dir}")
             return
         
-        for schema_file in self.schema_dir.glob("cir_*.json"):
-            schema_name = schema_file.name
-            try:
-                with open(schema_file, 'r') as f:
-                    schema = json.load(f)
-                
-                # Validate the schema itself
-                Draft7Validator.check_schema(schema)
-                
-                self.schemas[schema_name] = schema
-                logger.debug(f"Loaded schema: {schema_name}")
-                
-            except (json.JSONDecodeError, jsonschema.SchemaError) as e:
-                logger.error(f"Invalid schema {schema_file}: {e}")
+        # scandir reports names and file types without building a Path per entry
+        with os.scandir(self.schema_dir) as entries:
+            self._schema_paths = {
+                entry.name: entry.path
+                for entry in entries
+                if entry.name.startswith("cir_") and entry.name.endswith(".json") and entry.is_file()
+            }
+    
+    def _get_schema(self, schema_name: str) -> Optional[Dict[str, Any]]:
+        """Load, check and cache a schema and its validators on first request"""
+        schema = self.schemas.get(schema_name)
+        if schema is not None:
+            return schema
+        
+        schema_file = self._schema_paths.get(schema_name)
+        if schema_file is None:
+            return None
+        
+        try:
+            schema_bytes = Path(schema_file).read_bytes()
+            schema = loads(schema_bytes)
+            
+            # Validate the schema itself
+            Draft7Validator.check_schema(schema)
+            
+        except (json.JSONDecodeError, jsonschema.SchemaError) as e:
+            logger.error(f"Invalid schema {schema_file}: {e}")
+            # Treat an invalid schema as missing rather than re-reading it on every call
+            del self._schema_paths[schema_name]
+            return None
+        
+        self.schemas[schema_name] = schema
+        self._validators[schema_name] = Draft7Validator(schema)
+        self._compile_schema(schema_name, schema, schema_bytes)
+        logger.debug(f"Loaded schema: {schema_name}")
+        
+        return schema
+    
+    def _compile_schema(self, schema_name: str, schema: Dict[str, Any], schema_bytes: bytes) -> None:
+        """Compile schema to generated validation code when fastjsonschema is available"""
+        if fastjsonschema is None:
+            return
+        
+        compiled = self._load_cached_validator(schema_name, schema_bytes)
+        if compiled is not None:
+            self._compiled_validators[schema_name] = compiled
+            return
+        
+        try:
+            # Draft7Validator does not assert "format", so the compiled validator must not either
+            source = fastjsonschema.compile_to_code(schema, use_formats=False)
+        except fastjsonschema.JsonSchemaDefinitionException as e:
+            logger.debug(f"Falling back to jsonschema for {schema_name}: {e}")
+            return
+        
+        func_name = fastjsonschema.RefResolver.from_schema(schema, handlers={}, store={}).get_scope_name()
+        self._compiled_validators[schema_name] = self._exec_validator(schema_name, func_name, source)
+        
+        self._store_cached_source(schema_bytes, func_name, source)
+    
+    def _exec_validator(self, schema_name: str, func_name: str, source: str):
+        """Compile generated validator source and return its entry function"""
+        code = compile(source, schema_name, "exec")
+        
+        namespace = {}
+        exec(code, namespace)
+        return namespace[func_name]
+    
+    def _cache_path(self, schema_bytes: bytes) -> Path:
+        """Cache file for a schema's generated validator source
+        
+        The key covers the schema content and the fastjsonschema version, so a
+        change to either forces the code to be generated again.
+        """
+        key = hashlib.sha256(schema_bytes)
+        key.update(fastjsonschema.VERSION.encode())
+        return cache_dir() / "schemas" / f"{key.hexdigest()}.json"
+    
+    def _load_cached_validator(self, schema_name: str, schema_bytes: bytes):
+        """Compile validator source generated by an earlier run, if any
+        
+        The source is executed, so an entry is only trusted when the current user
+        owns it; entries written by anyone else are ignored.
+        """
+        try:
+            with open(self._cache_path(schema_bytes), 'rb') as f:
+                if hasattr(os, "getuid") and os.fstat(f.fileno()).st_uid != os.getuid():
+                    logger.warning(f"Ignoring schema cache entry not owned by the current user: {f.name}")
+                    return None
+                entry = loads(f.read())
+            return self._exec_validator(schema_name, entry["func_name"], entry["source"])
+        except FileNotFoundError:
+            return None
+        except (OSError, json.JSONDecodeError, SyntaxError, KeyError, TypeError, ValueError) as e:
+            logger.debug(f"Ignoring unreadable schema cache entry: {e}")
+            return None
+    
+    def _store_cached_source(self, schema_bytes: bytes, func_name: str, source: str) -> None:
+        """Persist generated validator source for later runs"""
+        try:
+            cache_path = self._cache_path(schema_bytes)
+            # Private to the current user, since entries are executed when loaded
+            cache_path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+            
+            # Write then rename so concurrent runs never read a partial entry
+            tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+            tmp_path.write_bytes(dumps({"func_name": func_name, "source": source}))
+            os.replace(tmp_path, cache_path)
+        except OSError as e:
+            logger.debug(f"Could not cache generated schema code: {e}")
+    
+    def _is_valid(self, data: Dict[str, Any], schema_name: str) -> bool:
+        """Check data against schema without collecting errors"""
+        compiled = self._compiled_validators.get(schema_name)
+        if compiled is None:
+            return self._validators[schema_name].is_valid(data)
+        
+        try:
+            compiled(data)
+            return True
+        except fastjsonschema.JsonSchemaValueException:
+            return False
     
     def validate(self, data: Dict[str, Any], schema_name: str) -> bool:
         """Validate data against specified schema"""
-        if schema_name not in self.schemas:
+        if self._get_schema(schema_name) is None:
             logger.error(f"Schema not found: {schema_name}")
             return False
         
-        schema = self.schemas[schema_name]
-        validator = Draft7Validator(schema)
-        
         try:
-            # Validate and collect all errors
-            errors = list(validator.iter_errors(data))
-            
-            if errors:
+            # The pass/fail check skips building error objects; jsonschema only walks
+            # the errors when reporting a failure
+            if not self._is_valid(data, schema_name):
                 logger.error(f"CIR validation failed for {schema_name}:")
-                for error in errors:
+                for error in self._validators[schema_name].iter_errors(data):
                     logger.error(f"  {error.message} at {' -> '.join(str(p) for p in error.absolute_path)}")
                 return False
             
@@ -72,7 +189,7 @@ class CIRValidator:
     
     def get_validation_report(self, data: Dict[str, Any], schema_name: str) -> Dict[str, Any]:
         """Get detailed validation report"""
-        if schema_name not in self.schemas:
+        if self._get_schema(schema_name) is None:
             return {
                 "valid": False,
                 "errors": [f"Schema not found: {schema_name}"],
@@ -80,8 +197,7 @@ class CIRValidator:
                 "schema": schema_name
             }
         
-        schema = self.schemas[schema_name]
-        validator = Draft7Validator(schema)
+        validator = self._validators[schema_name]
         
         errors = []
         warnings = []
@@ -8,35 +8,37 @@ into OSCAL v1.1.3 JSON artifacts, validates with NIST oscal-cli, and emits signe
 Anchors: OSCAL v1.1.3, OMB M-24-15, SP 800-53 Release 5.2.0, SP 800-171 r3, SP 800-18 r1
 """
 
-import json
+import hashlib
+import importlib.util
 import logging
+import os
+import shutil
 import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 import click
 from rich.console import Console
+from rich.highlighter import JSONHighlighter
 from rich.logging import RichHandler
 from rich.progress import Progress, SpinnerColumn, TextColumn
 
-# Import our modules - handle both direct execution and module import
+# Import our modules - handle both direct execution and module import.
+# Readers, mappers, CIR, validation and packaging pull in pandas, openpyxl,
+# pypandoc and jsonschema, so commands import them only when they run.
 try:
-    from .readers import DocumentReader, POAMReader, InventoryReader
-    from .mappers import SSPMapper, POAMMapper, InventoryMapper
-    from .cir import CIRValidator, CIRProcessor
-    from .validation import ValidationReporter, ValidationPipeline
-    from .packaging import BundleCreator, ManifestGenerator
+    from .cache import cache_dir
+    from .jsonio import dump_file, dumps, load_file
 except ImportError:
     # If relative imports fail, try absolute imports (when run directly)
     import sys
     from pathlib import Path
     sys.path.insert(0, str(Path(__file__).parent.parent))
     
-    from oscalize.readers import DocumentReader, POAMReader, InventoryReader
-    from oscalize.mappers import SSPMapper, POAMMapper, InventoryMapper
-    from oscalize.cir import CIRValidator, CIRProcessor
-    from oscalize.validation import ValidationReporter, ValidationPipeline
-    from oscalize.packaging import BundleCreator, ManifestGenerator
+    from oscalize.cache import cache_dir
+    from oscalize.jsonio import dump_file, dumps, load_file
 
 # Set up console and logging
 console = Console()
@@ -47,6 +49,82 @@ logging.basicConfig(
 )
 logger = logging.getLogger("oscalize")
 
+# How long a detected oscal-cli version is trusted before re-running it
+_OSCAL_CLI_CACHE_TTL = 24 * 60 * 60
+
+
+def _print_json(data: Any) -> None:
+    """Print highlighted JSON, serializing through jsonio rather than rich's stdlib encoder"""
+    text = JSONHighlighter()(dumps(data).decode('utf-8'))
+    text.no_wrap = True
+    text.overflow = None
+    console.print(text, soft_wrap=True)
+
+
+def _corpus_digest(corpus_dir: Path, include_validation: bool) -> str:
+    """Digest corpus files together with the oscalize sources, mappings and schemas
+    
+    With validation included, the oscal-cli on PATH is part of the digest too, so
+    a pass recorded against one validator is not reused for another.
+    """
+    digest = hashlib.sha256(f"include_validation={include_validation}".encode())
+    
+    if include_validation:
+        digest.update(_oscal_cli_identity().encode())
+    
+    roots = (corpus_dir, Path(__file__).parent, Path("mappings"), Path("schemas"))
+    for index, root in enumerate(roots):
+        if not root.is_dir():
+            continue
+        
+        file_paths = sorted(
+            path for path in root.rglob("*")
+            if path.is_file() and "__pycache__" not in path.parts
+        )
+        for file_path in file_paths:
+            digest.update(f"{index}:{file_path.relative_to(root)}\0".encode())
+            digest.update(file_path.read_bytes())
+    
+    return digest.hexdigest()
+
+
+def _oscal_cli_identity() -> str:
+    """Describe the oscal-cli on PATH by resolved path, file stat and version"""
+    oscal_cli_path = shutil.which('oscal-cli')
+    if oscal_cli_path is None:
+        return "oscal-cli=none"
+    
+    try:
+        stat = os.stat(oscal_cli_path)
+    except OSError:
+        return "oscal-cli=none"
+    
+    version, _ = _oscal_cli_version(oscal_cli_path, stat.st_mtime)
+    return (f"oscal-cli={os.path.realpath(oscal_cli_path)}:{stat.st_size}:"
+            f"{stat.st_mtime_ns}:{version}")
+
+
+class _NullProgress:
+    """Stand-in for rich Progress under --quiet; skips the spinner's refresh thread"""
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc_info) -> None:
+        return None
+    
+    def add_task(self, description: str, **kwargs) -> int:
+        return 0
+    
+    def update(self, task_id: int, **kwargs) -> None:
+        return None
+
+
+def _read_input(reader_cls, input_path: Path) -> Dict[str, Any]:
+    """Read one input file to CIR (module level so worker processes can run it)"""
+    return reader_cls(input_path).to_cir()
+
+
 @click.group()
 @click.option('--verbose', '-v', is_flag=True, help='Enable verbose output')
 @click.option('--quiet', '-q', is_flag=True, help='Suppress non-error output')
@@ -72,8 +150,11 @@ def cli(ctx, verbose: bool, quiet: bool):
               default=Path('mappings'), help='Directory containing mapping configurations')
 @click.option('--schema-dir', type=click.Path(exists=True, path_type=Path),
               default=Path('schemas'), help='Directory containing CIR JSON schemas')
+@click.option('--jobs', '-j', type=click.IntRange(min=1),
+              help='Worker processes for reading inputs (default: CPU count)')
 @click.pass_context
-def convert(ctx, inputs: List[Path], output: Path, mapping_dir: Path, schema_dir: Path):
+def convert(ctx, inputs: List[Path], output: Path, mapping_dir: Path, schema_dir: Path,
+            jobs: Optional[int]):
     """Convert input documents to OSCAL artifacts
     
     Accepts .docx/.md files for SSP content and .xlsx files for appendices
@@ -83,50 +164,91 @@ def convert(ctx, inputs: List[Path], output: Path, mapping_dir: Path, schema_dir
         logger.error("No input files specified")
         sys.exit(1)
     
+    try:
+        from .readers import DocumentReader, POAMReader, InventoryReader
+        from .mappers import SSPMapper, POAMMapper, InventoryMapper
+        from .cir import CIRValidator, CIRProcessor
+    except ImportError:
+        # If relative imports fail, try absolute imports (when run directly)
+        from oscalize.readers import DocumentReader, POAMReader, InventoryReader
+        from oscalize.mappers import SSPMapper, POAMMapper, InventoryMapper
+        from oscalize.cir import CIRValidator, CIRProcessor
+    
     output.mkdir(parents=True, exist_ok=True)
     
-    with Progress(
-        SpinnerColumn(),
-        TextColumn("[progress.description]{task.description}"),
-        console=console
-    ) as progress:
+    if ctx.obj['quiet']:
+        progress_display = _NullProgress()
+    else:
+        progress_display = Progress(
+            SpinnerColumn(),
+            TextColumn("[progress.description]{task.description}"),
+            console=console
+        )
+    
+    # Readers by file suffix as (filename prefix, CIR key, reader) candidates;
+    # workbooks are told apart by filename prefix
+    reader_dispatch = {
+        '.docx': (('', 'document', DocumentReader),),
+        '.md': (('', 'document', DocumentReader),),
+        '.xlsx': (
+            ('poam', 'poam', POAMReader),
+            ('inventory', 'inventory', InventoryReader)
+        )
+    }
+    
+    # Classify inputs up front so independent files can be parsed concurrently
+    read_jobs = []
+    for input_path in inputs:
+        name = input_path.name.lower()
+        for prefix, cir_key, reader_cls in reader_dispatch.get(input_path.suffix.lower(), ()):
+            if name.startswith(prefix):
+                read_jobs.append((cir_key, reader_cls, input_path))
+                break
+        else:
+            logger.warning("Unsupported file type: %s", input_path)
+    
+    # Workers are forked on the first submit, before the progress display starts
+    # its refresh thread, so no console or logging lock can be copied into a
+    # child while that thread holds it
+    max_workers = min(len(read_jobs), jobs or os.cpu_count() or 1)
+    executor = ProcessPoolExecutor(max_workers=max_workers) if max_workers > 1 else None
+    futures = [
+        executor.submit(_read_input, reader_cls, input_path)
+        for _, reader_cls, input_path in read_jobs
+    ] if executor else None
+    
+    with progress_display as progress:
         
-        # Phase 1: Read and validate inputs
+        # Phase 1: Read, validate and normalize inputs
         read_task = progress.add_task("Reading input documents...", total=None)
         cir_data = {}
         
-        for input_path in inputs:
-            try:
-                if input_path.suffix.lower() in ['.docx', '.md']:
-                    reader = DocumentReader(input_path)
-                    cir_data['document'] = reader.to_cir()
-                elif input_path.name.lower().startswith('poam') and input_path.suffix.lower() == '.xlsx':
-                    reader = POAMReader(input_path)
-                    cir_data['poam'] = reader.to_cir()
-                elif input_path.name.lower().startswith('inventory') and input_path.suffix.lower() == '.xlsx':
-                    reader = InventoryReader(input_path)
-                    cir_data['inventory'] = reader.to_cir()
-                else:
-                    logger.warning(f"Unsupported file type: {input_path}")
-            except Exception as e:
-                logger.error(f"Failed to read {input_path}: {e}")
-                if ctx.obj['verbose']:
-                    logger.exception(e)
-                sys.exit(1)
-        
-        progress.update(read_task, description="Validating CIR data...")
-        
-        # Phase 2: Validate CIR against schemas
         validator = CIRValidator(schema_dir)
         processor = CIRProcessor()
         
-        for data_type, data in cir_data.items():
-            if not validator.validate(data, f"cir_{data_type}.json"):
-                logger.error(f"CIR validation failed for {data_type}")
-                sys.exit(1)
-            
-            # Process and normalize CIR data
-            cir_data[data_type] = processor.process(data, data_type)
+        try:
+            # Results are handled in input order, so a later file of the same type
+            # still wins and the first failing input is the one reported. Each CIR is
+            # validated and normalized while later inputs are still being parsed.
+            for index, (cir_key, reader_cls, input_path) in enumerate(read_jobs):
+                try:
+                    data = futures[index].result() if futures else _read_input(reader_cls, input_path)
+                except Exception as e:
+                    logger.error("Failed to read %s: %s", input_path, e)
+                    if ctx.obj['verbose']:
+                        logger.exception("Traceback:")
+                    sys.exit(1)
+                
+                if not validator.validate(data, f"cir_{cir_key}.json"):
+                    logger.error("CIR validation failed for %s", cir_key)
+                    sys.exit(1)
+                
+                # Process and normalize CIR data
+                cir_data[cir_key] = processor.process(data, cir_key)
+        finally:
+            if executor is not None:
+                # Don't start remaining reads once an input has failed
+                executor.shutdown(cancel_futures=True)
         
         # Phase 3: Map CIR to OSCAL
         progress.update(read_task, description="Mapping to OSCAL...")
@@ -152,11 +274,10 @@ def convert(ctx, inputs: List[Path], output: Path, mapping_dir: Path, schema_dir
         
         for artifact_type, artifact_data in oscal_artifacts.items():
             output_path = output / f"{artifact_type}.json"
-            with open(output_path, 'w') as f:
-                json.dump(artifact_data, f, indent=2, ensure_ascii=False)
-            logger.info(f"Generated: {output_path}")
+            dump_file(artifact_data, output_path)
+            logger.info("Generated: %s", output_path)
     
-    logger.info(f"Conversion completed. Outputs in: {output}")
+    logger.info("Conversion completed. Outputs in: %s", output)
 
 
 @cli.command()
@@ -200,9 +321,9 @@ def validate_enhanced(ctx, oscal_dir: Path, use_docker: bool, oscal_cli_path: st
         logger.info("Enhanced OSCAL validation completed successfully")
         
     except Exception as e:
-        logger.error(f"Enhanced validation pipeline failed: {e}")
+        logger.error("Enhanced validation pipeline failed: %s", e)
         if ctx.obj['verbose']:
-            logger.exception(e)
+            logger.exception("Traceback:")
         sys.exit(1)
 
 
@@ -213,52 +334,86 @@ def validate_enhanced(ctx, oscal_dir: Path, use_docker: bool, oscal_cli_path: st
 @click.pass_context
 def validation_summary(ctx, validation_dir: Path, output: Optional[Path]):
     """Generate validation summary from oscal-cli logs"""
+    try:
+        from .validation import ValidationReporter
+    except ImportError:
+        # If relative imports fail, try absolute imports (when run directly)
+        from oscalize.validation import ValidationReporter
+    
     reporter = ValidationReporter(validation_dir)
     summary = reporter.generate_summary()
     
     if output:
-        with open(output, 'w') as f:
-            json.dump(summary, f, indent=2)
-        logger.info(f"Validation summary written to: {output}")
+        dump_file(summary, output)
+        logger.info("Validation summary written to: %s", output)
     else:
-        console.print_json(data=summary)
+        _print_json(summary)
 
 
 @cli.command()
 @click.argument('oscal_dir', type=click.Path(exists=True, path_type=Path))
 @click.option('--output', '-o', type=click.Path(path_type=Path),
               help='Output bundle file')
+@click.option('--compression', type=click.Choice(['gz', 'bz2', 'xz', 'zst', 'none']), default='gz',
+              help='Bundle compression (zst requires the pyzstd package)')
+@click.option('--jobs', '-j', type=click.IntRange(min=1),
+              help='Worker threads for file hashing (default: CPU count)')
 @click.pass_context
-def bundle(ctx, oscal_dir: Path, output: Optional[Path]):
+def bundle(ctx, oscal_dir: Path, output: Optional[Path], compression: str, jobs: Optional[int]):
     """Create signed deployment bundle with manifest"""
+    try:
+        from .packaging import BundleCreator
+    except ImportError:
+        # If relative imports fail, try absolute imports (when run directly)
+        from oscalize.packaging import BundleCreator
+    
     if not output:
-        output = Path('dist') / 'oscalize-bundle.tar.gz'
+        suffix = '.tar' if compression == 'none' else f'.tar.{compression}'
+        output = Path('dist') / f'oscalize-bundle{suffix}'
     
     output.parent.mkdir(parents=True, exist_ok=True)
     
-    creator = BundleCreator()
-    bundle_path = creator.create_bundle(oscal_dir, output)
+    creator = BundleCreator(jobs=jobs)
+    try:
+        bundle_path = creator.create_bundle(oscal_dir, output, compression=compression)
+    except ValueError as e:
+        logger.error("%s", e)
+        sys.exit(1)
     
-    logger.info(f"Bundle created: {bundle_path}")
+    logger.info("Bundle created: %s", bundle_path)
 
 
 @cli.command()
 @click.argument('oscal_dir', type=click.Path(exists=True, path_type=Path))
 @click.option('--output', '-o', type=click.Path(path_type=Path),
               help='Output manifest file')
+@click.option('--hash-algo', type=click.Choice(['sha256', 'blake3']), default='sha256',
+              help='File hash algorithm (blake3 requires the blake3 package)')
+@click.option('--jobs', '-j', type=click.IntRange(min=1),
+              help='Worker threads for file hashing (default: CPU count)')
 @click.pass_context
-def manifest(ctx, oscal_dir: Path, output: Optional[Path]):
+def manifest(ctx, oscal_dir: Path, output: Optional[Path], hash_algo: str, jobs: Optional[int]):
     """Generate manifest with hashes and timestamps"""
+    try:
+        from .packaging import ManifestGenerator
+    except ImportError:
+        # If relative imports fail, try absolute imports (when run directly)
+        from oscalize.packaging import ManifestGenerator
+    
     if not output:
         output = oscal_dir / 'manifest.json'
     
-    generator = ManifestGenerator()
+    try:
+        generator = ManifestGenerator(hash_algorithm=hash_algo, jobs=jobs)
+    except ValueError as e:
+        logger.error("%s", e)
+        sys.exit(1)
+    
     manifest_data = generator.generate(oscal_dir)
     
-    with open(output, 'w') as f:
-        json.dump(manifest_data, f, indent=2)
+    dump_file(manifest_data, output)
     
-    logger.info(f"Manifest generated: {output}")
+    logger.info("Manifest generated: %s", output)
 
 
 @cli.command()
@@ -276,9 +431,9 @@ def test_corpus(ctx, corpus_dir: Path):
     results = tester.run_tests()
     
     if results['passed'] == results['total']:
-        logger.info(f"All {results['total']} corpus tests passed")
+        logger.info("All %s corpus tests passed", results['total'])
     else:
-        logger.error(f"{results['failed']} of {results['total']} corpus tests failed")
+        logger.error("%s of %s corpus tests failed", results['failed'], results['total'])
         sys.exit(1)
 
 
@@ -288,16 +443,32 @@ def test_corpus(ctx, corpus_dir: Path):
               help='Include OSCAL validation in corpus testing')
 @click.option('--working-dir', type=click.Path(path_type=Path),
               help='Working directory for test execution')
+@click.option('--force', is_flag=True,
+              help='Run tests even when a cached pass matches the current inputs '
+                   '(a cached pass writes no working-dir outputs or reports)')
 @click.pass_context
 def test_corpus_enhanced(ctx, corpus_dir: Path, include_validation: bool, 
-                        working_dir: Optional[Path]):
-    """Run enhanced corpus testing with real conversion and validation"""
+                        working_dir: Optional[Path], force: bool):
+    """Run enhanced corpus testing with real conversion and validation
+    
+    A pass is cached against the corpus, oscalize sources, mappings, schemas and,
+    with --include-validation, the oscal-cli on PATH. When all of these are
+    unchanged the run is skipped, so nothing is written to the working
+    directory; use --force to regenerate its outputs and reports.
+    """
     try:
         from .testing import EnhancedCorpusTester
     except ImportError:
         # If relative imports fail, try absolute imports (when run directly)
         from oscalize.testing import EnhancedCorpusTester
     
+    # A passing run is recorded under a digest of the corpus and of everything that
+    # shapes conversion output, so unchanged inputs need not be converted again
+    cached_result = cache_dir() / "corpus" / f"{_corpus_digest(corpus_dir, include_validation)}.json"
+    if not force and cached_result.exists():
+        logger.info("Enhanced corpus testing passed (cached result for unchanged inputs)")
+        return
+    
     try:
         tester = EnhancedCorpusTester(
             corpus_dir=corpus_dir,
@@ -313,16 +484,21 @@ def test_corpus_enhanced(ctx, corpus_dir: Path, include_validation: bool,
         # Exit with appropriate code
         if results.get("executive_summary", {}).get("status") == "PASS":
             logger.info("Enhanced corpus testing completed successfully")
+            try:
+                cached_result.parent.mkdir(parents=True, exist_ok=True)
+                dump_file(results["executive_summary"], cached_result)
+            except OSError as e:
+                logger.debug("Could not cache corpus test result: %s", e)
         else:
             failed = results.get("executive_summary", {}).get("failed", 0)
             errors = results.get("executive_summary", {}).get("errors", 0)
-            logger.error(f"Enhanced corpus testing failed: {failed} failed, {errors} errors")
+            logger.error("Enhanced corpus testing failed: %s failed, %s errors", failed, errors)
             sys.exit(1)
     
     except Exception as e:
-        logger.error(f"Enhanced corpus testing failed: {e}")
+        logger.error("Enhanced corpus testing failed: %s", e)
         if ctx.obj['verbose']:
-            logger.exception(e)
+            logger.exception("Traceback:")
         sys.exit(1)
 
 
@@ -349,8 +525,7 @@ def generate_corpus(ctx, corpus_dir: Path, samples_dir: Path,
         
         descriptions = None
         if test_descriptions:
-            with open(test_descriptions, 'r') as f:
-                descriptions = json.load(f)
+            descriptions = load_file(test_descriptions)
         
         results = generator.generate_from_samples(
             samples_dir=samples_dir,
@@ -360,14 +535,14 @@ def generate_corpus(ctx, corpus_dir: Path, samples_dir: Path,
         successful = results.get("summary", {}).get("successful", 0)
         failed = results.get("summary", {}).get("failed", 0)
         
-        logger.info(f"Generated {successful} corpus test cases")
+        logger.info("Generated %s corpus test cases", successful)
         if failed > 0:
-            logger.warning(f"{failed} test cases failed to generate")
+            logger.warning("%s test cases failed to generate", failed)
         
     except Exception as e:
-        logger.error(f"Corpus generation failed: {e}")
+        logger.error("Corpus generation failed: %s", e)
         if ctx.obj['verbose']:
-            logger.exception(e)
+            logger.exception("Traceback:")
         sys.exit(1)
 
 
@@ -399,12 +574,12 @@ def create_golden_test(ctx, corpus_dir: Path, inputs_dir: Path,
             description=description or "Generated from current inputs"
         )
         
-        logger.info(f"Golden test case created: {test_dir}")
+        logger.info("Golden test case created: %s", test_dir)
         
     except Exception as e:
-        logger.error(f"Failed to create golden test case: {e}")
+        logger.error("Failed to create golden test case: %s", e)
         if ctx.obj['verbose']:
-            logger.exception(e)
+            logger.exception("Traceback:")
         sys.exit(1)
 
 
@@ -427,7 +602,7 @@ def validate_corpus_integrity(ctx, corpus_dir: Path):
         
         integrity_report = tester.validate_corpus_integrity()
         
-        console.print_json(data=integrity_report)
+        _print_json(integrity_report)
         
         if integrity_report.get("invalid_test_cases", 0) > 0:
             logger.error("Corpus integrity issues found")
@@ -436,26 +611,34 @@ def validate_corpus_integrity(ctx, corpus_dir: Path):
             logger.info("Corpus integrity validation passed")
     
     except Exception as e:
-        logger.error(f"Corpus integrity validation failed: {e}")
+        logger.error("Corpus integrity validation failed: %s", e)
         if ctx.obj['verbose']:
-            logger.exception(e)
+            logger.exception("Traceback:")
         sys.exit(1)
 
 
 @cli.command()
 @click.argument('manifest_file', type=click.Path(exists=True, path_type=Path))
+@click.option('--jobs', '-j', type=click.IntRange(min=1),
+              help='Worker threads for file hashing (default: CPU count)')
 @click.pass_context
-def verify_manifest(ctx, manifest_file: Path):
+def verify_manifest(ctx, manifest_file: Path, jobs: Optional[int]):
     """Verify manifest integrity and file hashes"""
-    generator = ManifestGenerator()
+    try:
+        from .packaging import ManifestGenerator
+    except ImportError:
+        # If relative imports fail, try absolute imports (when run directly)
+        from oscalize.packaging import ManifestGenerator
+    
+    generator = ManifestGenerator(jobs=jobs)
     verification_results = generator.verify_manifest(manifest_file)
     
     if verification_results.get("valid", False):
         logger.info("Manifest verification passed")
-        console.print_json(data=verification_results)
+        _print_json(verification_results)
     else:
         logger.error("Manifest verification failed")
-        console.print_json(data=verification_results)
+        _print_json(verification_results)
         sys.exit(1)
 
 
@@ -464,15 +647,21 @@ def verify_manifest(ctx, manifest_file: Path):
 @click.pass_context
 def verify_bundle(ctx, bundle_file: Path):
     """Verify bundle integrity without full extraction"""
+    try:
+        from .packaging import BundleCreator
+    except ImportError:
+        # If relative imports fail, try absolute imports (when run directly)
+        from oscalize.packaging import BundleCreator
+    
     creator = BundleCreator()
     verification_results = creator.verify_bundle_integrity(bundle_file)
     
     if verification_results.get("valid", False):
         logger.info("Bundle integrity verification passed")
-        console.print_json(data=verification_results)
+        _print_json(verification_results)
     else:
         logger.error("Bundle integrity verification failed")
-        console.print_json(data=verification_results)
+        _print_json(verification_results)
         sys.exit(1)
 
 
@@ -481,23 +670,37 @@ def verify_bundle(ctx, bundle_file: Path):
 @click.pass_context
 def list_bundle(ctx, bundle_file: Path):
     """List contents of bundle without extracting"""
+    try:
+        from .packaging import BundleCreator
+    except ImportError:
+        # If relative imports fail, try absolute imports (when run directly)
+        from oscalize.packaging import BundleCreator
+    
     creator = BundleCreator()
     contents = creator.list_bundle_contents(bundle_file)
     
-    console.print_json(data={"bundle_contents": contents})
+    _print_json({"bundle_contents": contents})
 
 
 @cli.command()
 @click.argument('bundle_file', type=click.Path(exists=True, path_type=Path))
 @click.argument('extract_dir', type=click.Path(path_type=Path))
+@click.option('--jobs', '-j', type=click.IntRange(min=1),
+              help='Worker threads for file hashing (default: CPU count)')
 @click.pass_context
-def extract_bundle(ctx, bundle_file: Path, extract_dir: Path):
+def extract_bundle(ctx, bundle_file: Path, extract_dir: Path, jobs: Optional[int]):
     """Extract bundle and verify integrity"""
-    creator = BundleCreator()
+    try:
+        from .packaging import BundleCreator
+    except ImportError:
+        # If relative imports fail, try absolute imports (when run directly)
+        from oscalize.packaging import BundleCreator
+    
+    creator = BundleCreator(jobs=jobs)
     extraction_results = creator.extract_bundle(bundle_file, extract_dir)
     
-    logger.info(f"Bundle extracted to: {extraction_results['extracted_to']}")
-    console.print_json(data=extraction_results)
+    logger.info("Bundle extracted to: %s", extraction_results['extracted_to'])
+    _print_json(extraction_results)
     
     # Exit with error if verification failed
     if extraction_results.get("metadata", {}).get("verification", {}).get("valid") is False:
@@ -507,8 +710,10 @@ def extract_bundle(ctx, bundle_file: Path, extract_dir: Path):
 
 @cli.command()
 @click.argument('oscal_dir', type=click.Path(exists=True, path_type=Path))
+@click.option('--force', is_flag=True,
+              help='Re-run checks even when a cached result matches the current artifacts')
 @click.pass_context
-def compliance_check(ctx, oscal_dir: Path):
+def compliance_check(ctx, oscal_dir: Path, force: bool):
     """Check compliance with M-24-15 and FedRAMP requirements"""
     try:
         from .compliance import ComplianceChecker
@@ -517,9 +722,9 @@ def compliance_check(ctx, oscal_dir: Path):
         from oscalize.compliance import ComplianceChecker
     
     checker = ComplianceChecker()
-    results = checker.check_directory(oscal_dir)
+    results = checker.check_directory(oscal_dir, use_cache=not force)
     
-    console.print_json(data=results)
+    _print_json(results)
     
     if not results.get('compliance_check', {}).get('compliant', False):
         logger.error("Compliance check failed")
@@ -529,13 +734,14 @@ def compliance_check(ctx, oscal_dir: Path):
 @cli.command()
 @click.option('--check-deps', is_flag=True, help='Check required dependencies')
 @click.option('--check-oscal-cli', is_flag=True, help='Check NIST oscal-cli availability')
-def doctor(check_deps: bool, check_oscal_cli: bool):
+@click.option('--force', is_flag=True, help='Re-run oscal-cli instead of using the cached version')
+def doctor(check_deps: bool, check_oscal_cli: bool, force: bool):
     """Diagnostic tool for oscalize installation"""
     if check_deps or not (check_deps or check_oscal_cli):
         _check_python_deps()
     
     if check_oscal_cli or not (check_deps or check_oscal_cli):
-        _check_oscal_cli()
+        _check_oscal_cli(force=force)
 
 
 def _check_python_deps():
@@ -543,30 +749,94 @@ def _check_python_deps():
     required = ['pandas', 'openpyxl', 'pypandoc', 'jsonschema', 'click', 'rich']
     missing = []
     
+    # find_spec locates a package without executing it; importing pandas alone
+    # takes hundreds of milliseconds
     for pkg in required:
-        try:
-            __import__(pkg)
-        except ImportError:
+        if importlib.util.find_spec(pkg) is None:
             missing.append(pkg)
     
     if missing:
-        logger.error(f"Missing Python dependencies: {', '.join(missing)}")
+        logger.error("Missing Python dependencies: %s", ', '.join(missing))
         logger.info("Run: pip install -r requirements.txt")
     else:
         logger.info("All Python dependencies satisfied")
 
 
-def _check_oscal_cli():
+def _check_oscal_cli(force: bool = False):
     """Check NIST oscal-cli availability"""
+    oscal_cli_path = shutil.which('oscal-cli')
+    if oscal_cli_path is None:
+        logger.error("oscal-cli not found or not working")
+        logger.info("Install with: task install-oscal-cli")
+        return
+    
+    version, cached = _oscal_cli_version(oscal_cli_path, os.stat(oscal_cli_path).st_mtime, force)
+    if version is None:
+        logger.error("oscal-cli not found or not working")
+        logger.info("Install with: task install-oscal-cli")
+        return
+    
+    if cached:
+        logger.info("oscal-cli found: %s (cached)", version)
+    else:
+        logger.info("oscal-cli found: %s", version)
+
+
+def _oscal_cli_version(oscal_cli_path: str, mtime: float, force: bool = False) -> Tuple[Optional[str], bool]:
+    """Report the oscal-cli version and whether it came from the cache
+    
+    oscal-cli is a JVM launcher that takes seconds to start, so the last reported
+    version is reused while the executable is unchanged. The version is None when
+    oscal-cli does not run.
+    """
     import subprocess
     
+    cache_file = cache_dir() / "oscal_cli.json"
+    
+    if not force:
+        version = _cached_oscal_cli_version(cache_file, oscal_cli_path, mtime)
+        if version is not None:
+            return version, True
+    
     try:
-        result = subprocess.run(['oscal-cli', '--version'], 
+        result = subprocess.run([oscal_cli_path, '--version'], 
                               capture_output=True, text=True, check=True)
-        logger.info(f"oscal-cli found: {result.stdout.strip()}")
     except (subprocess.CalledProcessError, FileNotFoundError):
-        logger.error("oscal-cli not found or not working")
-        logger.info("Install with: task install-oscal-cli")
+        return None, False
+    
+    version = result.stdout.strip()
+    
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        dump_file({
+            "path": oscal_cli_path,
+            "mtime": mtime,
+            "version": version,
+            "checked_at": time.time()
+        }, cache_file)
+    except OSError as e:
+        logger.debug("Could not cache oscal-cli version: %s", e)
+    
+    return version, False
+
+
+def _cached_oscal_cli_version(cache_file: Path, oscal_cli_path: str, mtime: float) -> Optional[str]:
+    """Return the cached oscal-cli version if it is recent and matches the executable"""
+    try:
+        cached = load_file(cache_file)
+    except (OSError, ValueError):
+        return None
+    
+    if not isinstance(cached, dict):
+        return None
+    
+    if cached.get("path") != oscal_cli_path or cached.get("mtime") != mtime:
+        return None
+    
+    if time.time() - cached.get("checked_at", 0) > _OSCAL_CLI_CACHE_TTL:
+        return None
+    
+    return cached.get("version")
 
 
 if __name__ == '__main__':
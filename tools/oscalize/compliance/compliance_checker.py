@@ -4,21 +4,35 @@ Compliance checker for M-24-15, FedRAMP and other requirements
 Checks OSCAL artifacts against compliance requirements and standards.
 """
 
+import hashlib
 import json
 import logging
-from datetime import datetime
+import os
+from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
+from ..cache import cache_dir
+from ..jsonio import dump_file, dumps_compact, load_file, loads
+
 logger = logging.getLogger(__name__)
 
+# Root keys that identify an OSCAL artifact; the key is also the artifact type
+_OSCAL_ARTIFACT_TYPES = frozenset({
+    "system-security-plan",
+    "plan-of-action-and-milestones",
+    "assessment-plan",
+    "assessment-results",
+    "component-definition",
+    "profile",
+    "catalog"
+})
+
 
 class ComplianceChecker:
     """Checker for compliance against various standards"""
     
     def __init__(self):
-        self.timestamp = datetime.utcnow().isoformat() + "Z"
-        
         # M-24-15 requirements
         self.m24_15_requirements = {
             "machine_readable": True,
@@ -52,37 +66,98 @@ class ComplianceChecker:
                 "MA", "MP", "PE", "PL", "PS", "RA", "SA", "SC", "SI", "SR"
             ]
         }
+        self._required_control_families = frozenset(
+            self.nist_800_53_requirements["required_control_families"]
+        )
     
-    def check_directory(self, directory: Path) -> Dict[str, Any]:
-        """Check all OSCAL artifacts in directory for compliance"""
+    def check_directory(self, directory: Path, use_cache: bool = False) -> Dict[str, Any]:
+        """Check all OSCAL artifacts in directory for compliance
+        
+        With use_cache, a report from an earlier run is reused when no JSON
+        file in the directory has changed since; its timestamp and directory
+        are refreshed to describe this run.
+        """
         logger.info(f"Checking compliance for directory: {directory}")
         
         if not directory.exists():
             return self._create_error_result(f"Directory not found: {directory}")
         
+        if not use_cache:
+            return self._check_artifacts(directory)
+        
+        cache_path = self._result_cache_path(directory)
+        try:
+            compliance_report = loads(cache_path.read_bytes())
+            compliance_check = compliance_report["compliance_check"]
+            compliance_check["timestamp"] = self._current_timestamp()
+            compliance_check["directory"] = str(directory)
+            logger.info("Using cached compliance result for unchanged artifacts")
+            return compliance_report
+        except FileNotFoundError:
+            pass
+        except (OSError, json.JSONDecodeError, KeyError, TypeError) as e:
+            logger.debug(f"Ignoring unreadable compliance cache entry: {e}")
+        
+        compliance_report = self._check_artifacts(directory)
+        
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            dump_file(compliance_report, cache_path)
+        except OSError as e:
+            logger.debug(f"Could not cache compliance result: {e}")
+        
+        return compliance_report
+    
+    def _result_cache_path(self, directory: Path) -> Path:
+        """Cache file for a directory's report
+        
+        The key covers the directory, the name, size and modification time of
+        each JSON file in it, the requirements checked and this module's source,
+        so any change to these forces a fresh check.
+        """
+        key = hashlib.sha256(str(directory.resolve()).encode())
+        key.update(dumps_compact([
+            self.m24_15_requirements,
+            self.fedramp_requirements,
+            self.nist_800_53_requirements
+        ]))
+        key.update(Path(__file__).read_bytes())
+        
+        for entry in sorted(self._scan_json_files(directory), key=lambda entry: entry.name):
+            try:
+                stat = entry.stat()
+            except OSError:
+                continue  # Unreadable entries are skipped by discovery as well
+            key.update(f"\0{entry.name}:{stat.st_size}:{stat.st_mtime_ns}".encode())
+        
+        return cache_dir() / "compliance" / f"{key.hexdigest()}.json"
+    
+    def _check_artifacts(self, directory: Path) -> Dict[str, Any]:
+        """Run all compliance checks over the artifacts in directory"""
         # Discover OSCAL artifacts
         artifacts = self._discover_oscal_artifacts(directory)
+        timestamp = self._current_timestamp()
         
-        compliance_report = {
-            "compliance_check": {
-                "timestamp": self.timestamp,
-                "directory": str(directory),
-                "artifacts_found": len(artifacts),
-                "compliant": True,
-                "compliance_score": 0.0,
-                "checks_performed": {},
-                "violations": [],
-                "recommendations": [],
-                "summary": {}
-            }
-        }
+        # Results are gathered in locals and the report is assembled once at the end
+        compliant = True
+        checks_performed = {}
+        violations = []
+        recommendations = []
         
         if not artifacts:
-            compliance_report["compliance_check"]["compliant"] = False
-            compliance_report["compliance_check"]["violations"].append(
-                "No OSCAL artifacts found for compliance checking"
-            )
-            return compliance_report
+            return {
+                "compliance_check": {
+                    "timestamp": timestamp,
+                    "directory": str(directory),
+                    "artifacts_found": 0,
+                    "compliant": False,
+                    "compliance_score": 0.0,
+                    "checks_performed": checks_performed,
+                    "violations": ["No OSCAL artifacts found for compliance checking"],
+                    "recommendations": recommendations,
+                    "summary": {}
+                }
+            }
         
         # Perform compliance checks
         checks = [
@@ -95,58 +170,62 @@ class ComplianceChecker:
         total_score = 0
         max_score = len(checks) * 100
         
+        # Each check looks artifacts up by type; index them once for all checks
+        artifacts_by_type = self._index_artifacts_by_type(artifacts)
+        
         for check_name, check_function in checks:
             try:
-                result = check_function(artifacts)
-                compliance_report["compliance_check"]["checks_performed"][check_name] = result
+                result = check_function(artifacts, artifacts_by_type)
+                checks_performed[check_name] = result
                 
                 total_score += result.get("score", 0)
                 
                 if not result.get("compliant", False):
-                    compliance_report["compliance_check"]["compliant"] = False
+                    compliant = False
                 
                 # Collect violations and recommendations
-                compliance_report["compliance_check"]["violations"].extend(
-                    result.get("violations", [])
-                )
-                compliance_report["compliance_check"]["recommendations"].extend(
-                    result.get("recommendations", [])
-                )
+                violations.extend(result.get("violations", []))
+                recommendations.extend(result.get("recommendations", []))
                 
             except Exception as e:
                 logger.error(f"Compliance check {check_name} failed: {e}")
-                compliance_report["compliance_check"]["violations"].append(
-                    f"Compliance check error ({check_name}): {str(e)}"
-                )
-                compliance_report["compliance_check"]["compliant"] = False
-        
-        # Calculate overall compliance score
-        compliance_report["compliance_check"]["compliance_score"] = (
-            (total_score / max_score * 100) if max_score > 0 else 0
-        )
+                violations.append(f"Compliance check error ({check_name}): {str(e)}")
+                compliant = False
+        
+        compliance_check = {
+            "timestamp": timestamp,
+            "directory": str(directory),
+            "artifacts_found": len(artifacts),
+            "compliant": compliant,
+            # Calculate overall compliance score
+            "compliance_score": (total_score / max_score * 100) if max_score > 0 else 0,
+            "checks_performed": checks_performed,
+            "violations": violations,
+            "recommendations": recommendations
+        }
         
         # Generate summary
-        compliance_report["compliance_check"]["summary"] = self._generate_summary(
-            compliance_report["compliance_check"]
-        )
+        compliance_check["summary"] = self._generate_summary(compliance_check)
         
-        return compliance_report
+        return {"compliance_check": compliance_check}
     
     def _discover_oscal_artifacts(self, directory: Path) -> List[Dict[str, Any]]:
         """Discover OSCAL artifacts in directory"""
         artifacts = []
         
-        for file_path in directory.glob("*.json"):
+        for entry in self._scan_json_files(directory):
+            file_path = entry.path
             try:
-                with open(file_path, 'r') as f:
-                    content = json.load(f)
+                content = load_file(file_path)
                 
                 artifact_type = self._identify_oscal_artifact_type(content)
                 if artifact_type:
                     artifacts.append({
-                        "file": str(file_path),
+                        "file": file_path,
                         "type": artifact_type,
-                        "content": content
+                        "content": content,
+                        # Structure is checked once here and reused by each compliance check
+                        "valid": self._validate_oscal_structure(content)
                     })
                     
             except (json.JSONDecodeError, IOError) as e:
@@ -155,25 +234,31 @@ class ComplianceChecker:
         logger.info(f"Discovered {len(artifacts)} OSCAL artifacts")
         return artifacts
     
+    def _index_artifacts_by_type(self, artifacts: List[Dict[str, Any]]) -> Dict[str, List[Dict[str, Any]]]:
+        """Group artifacts by OSCAL type, keeping discovery order within each type"""
+        artifacts_by_type = {}
+        for artifact in artifacts:
+            artifacts_by_type.setdefault(artifact["type"], []).append(artifact)
+        return artifacts_by_type
+    
+    def _scan_json_files(self, directory: Path) -> List[os.DirEntry]:
+        """List JSON files in directory
+        
+        scandir reports names and file types without a stat or Path per entry.
+        """
+        with os.scandir(directory) as entries:
+            return [
+                entry for entry in entries
+                if entry.name.endswith(".json") and entry.is_file()
+            ]
+    
     def _identify_oscal_artifact_type(self, content: Dict[str, Any]) -> Optional[str]:
         """Identify OSCAL artifact type from content"""
-        oscal_types = {
-            "system-security-plan": "system-security-plan",
-            "plan-of-action-and-milestones": "plan-of-action-and-milestones",
-            "assessment-plan": "assessment-plan",
-            "assessment-results": "assessment-results",
-            "component-definition": "component-definition",
-            "profile": "profile",
-            "catalog": "catalog"
-        }
-        
-        for key in content.keys():
-            if key in oscal_types:
-                return oscal_types[key]
-        
-        return None
+        # First matching root key in document order, as an artifact may carry several
+        return next((key for key in content if key in _OSCAL_ARTIFACT_TYPES), None)
     
-    def _check_m24_15_compliance(self, artifacts: List[Dict[str, Any]]) -> Dict[str, Any]:
+    def _check_m24_15_compliance(self, artifacts: List[Dict[str, Any]],
+                                 artifacts_by_type: Dict[str, List[Dict[str, Any]]]) -> Dict[str, Any]:
         """Check OMB M-24-15 compliance requirements"""
         result = {
             "compliant": True,
@@ -193,10 +278,10 @@ class ComplianceChecker:
             result["details"]["machine_readable"] = False
         
         # Check for standardized OSCAL format
-        oscal_artifacts = [a for a in artifacts if a["type"] in [
+        oscal_artifacts = any(artifact_type in artifacts_by_type for artifact_type in (
             "system-security-plan", "plan-of-action-and-milestones",
             "assessment-plan", "assessment-results"
-        ]]
+        ))
         
         if oscal_artifacts:
             result["score"] += 25
@@ -218,8 +303,7 @@ class ComplianceChecker:
             result["details"]["automated_processing"] = False
         
         # Check for required SSP
-        ssp_artifacts = [a for a in artifacts if a["type"] == "system-security-plan"]
-        if ssp_artifacts:
+        if "system-security-plan" in artifacts_by_type:
             result["score"] += 25
             result["details"]["required_ssp"] = True
         else:
@@ -236,7 +320,8 @@ class ComplianceChecker:
         
         return result
     
-    def _check_fedramp_compliance(self, artifacts: List[Dict[str, Any]]) -> Dict[str, Any]:
+    def _check_fedramp_compliance(self, artifacts: List[Dict[str, Any]],
+                                  artifacts_by_type: Dict[str, List[Dict[str, Any]]]) -> Dict[str, Any]:
         """Check FedRAMP compliance requirements"""
         result = {
             "compliant": True,
@@ -246,11 +331,8 @@ class ComplianceChecker:
             "details": {}
         }
         
-        # Check for required artifacts
-        artifact_types = {a["type"] for a in artifacts}
-        
         # SSP required
-        if "system-security-plan" in artifact_types:
+        if "system-security-plan" in artifacts_by_type:
             result["score"] += 40
             result["details"]["ssp_present"] = True
         else:
@@ -259,7 +341,7 @@ class ComplianceChecker:
             result["details"]["ssp_present"] = False
         
         # POA&M required
-        if "plan-of-action-and-milestones" in artifact_types:
+        if "plan-of-action-and-milestones" in artifacts_by_type:
             result["score"] += 40
             result["details"]["poam_present"] = True
         else:
@@ -285,7 +367,8 @@ class ComplianceChecker:
         
         return result
     
-    def _check_nist_800_53_compliance(self, artifacts: List[Dict[str, Any]]) -> Dict[str, Any]:
+    def _check_nist_800_53_compliance(self, artifacts: List[Dict[str, Any]],
+                                      artifacts_by_type: Dict[str, List[Dict[str, Any]]]) -> Dict[str, Any]:
         """Check NIST SP 800-53 compliance"""
         result = {
             "compliant": True,
@@ -296,7 +379,7 @@ class ComplianceChecker:
         }
         
         # Find SSP artifacts for control analysis
-        ssp_artifacts = [a for a in artifacts if a["type"] == "system-security-plan"]
+        ssp_artifacts = artifacts_by_type.get("system-security-plan", [])
         
         if not ssp_artifacts:
             result["compliant"] = False
@@ -312,17 +395,16 @@ class ComplianceChecker:
             controls = self._extract_implemented_controls(ssp["content"])
             implemented_controls.update(controls)
             
-            # Extract control families
-            for control_id in controls:
-                if "-" in control_id:
-                    family = control_id.split("-")[0]
-                    control_families.add(family)
+            # Extract control families; partition avoids building a list per ID
+            control_families.update(
+                control_id.partition("-")[0] for control_id in controls if "-" in control_id
+            )
         
         result["details"]["implemented_controls"] = len(implemented_controls)
         result["details"]["control_families"] = list(control_families)
         
         # Score based on control coverage
-        required_families = set(self.nist_800_53_requirements["required_control_families"])
+        required_families = self._required_control_families
         family_coverage = len(control_families.intersection(required_families)) / len(required_families)
         
         result["score"] = int(family_coverage * 100)
@@ -340,7 +422,8 @@ class ComplianceChecker:
         
         return result
     
-    def _check_oscal_format_compliance(self, artifacts: List[Dict[str, Any]]) -> Dict[str, Any]:
+    def _check_oscal_format_compliance(self, artifacts: List[Dict[str, Any]],
+                                       artifacts_by_type: Dict[str, List[Dict[str, Any]]]) -> Dict[str, Any]:
         """Check OSCAL format compliance"""
         result = {
             "compliant": True,
@@ -355,11 +438,7 @@ class ComplianceChecker:
             result["violations"].append("No artifacts to check for OSCAL format compliance")
             return result
         
-        valid_artifacts = 0
-        
-        for artifact in artifacts:
-            if self._validate_oscal_structure(artifact["content"]):
-                valid_artifacts += 1
+        valid_artifacts = self._count_valid_artifacts(artifacts)
         
         compliance_rate = valid_artifacts / len(artifacts)
         result["score"] = int(compliance_rate * 100)
@@ -377,13 +456,7 @@ class ComplianceChecker:
     
     def _count_valid_artifacts(self, artifacts: List[Dict[str, Any]]) -> int:
         """Count artifacts that appear valid for automated processing"""
-        valid_count = 0
-        
-        for artifact in artifacts:
-            if self._validate_oscal_structure(artifact["content"]):
-                valid_count += 1
-        
-        return valid_count
+        return sum(1 for artifact in artifacts if artifact["valid"])
     
     def _validate_oscal_structure(self, content: Dict[str, Any]) -> bool:
         """Basic OSCAL structure validation"""
@@ -415,26 +488,40 @@ class ComplianceChecker:
         """Check for FedRAMP-specific content and return score 0-20"""
         # Look for FedRAMP-specific elements (4 points each, max 20)
         fedramp_indicators = [
-            "fedramp",
-            "cloud service provider",
-            "authorization boundary", 
-            "fips 199",
-            "customer responsibility matrix"
+            b"fedramp",
+            b"cloud service provider",
+            b"authorization boundary", 
+            b"fips 199",
+            b"customer responsibility matrix"
         ]
         
-        # Track which indicators have been found to avoid double counting
-        found_indicators = set()
+        # Only indicators not yet found are searched for in later artifacts, which
+        # also avoids double counting; each search is a single memchr-based scan
+        remaining_indicators = fedramp_indicators
         
         for artifact in artifacts:
-            content_str = json.dumps(artifact["content"]).lower()
-            for indicator in fedramp_indicators:
-                if indicator in content_str:
-                    found_indicators.add(indicator)
+            content_bytes = self._get_search_bytes(artifact)
+            remaining_indicators = [
+                indicator for indicator in remaining_indicators
+                if indicator not in content_bytes
+            ]
+            if not remaining_indicators:
+                break  # Maximum score reached; later artifacts are never serialized
         
         # Award 4 points for each unique indicator found
-        score = len(found_indicators) * 4
+        score = (len(fedramp_indicators) - len(remaining_indicators)) * 4
         return min(score, 20)  # Cap at 20 points
     
+    def _get_search_bytes(self, artifact: Dict[str, Any]) -> bytes:
+        """Lowercased serialized artifact for content searches, built once per artifact"""
+        search_bytes = artifact.get("search_bytes")
+        if search_bytes is None:
+            # Search terms are ASCII, so lowercased UTF-8 bytes give the same
+            # matches as lowercased text without decoding
+            search_bytes = dumps_compact(artifact["content"]).lower()
+            artifact["search_bytes"] = search_bytes
+        return search_bytes
+    
     def _extract_implemented_controls(self, ssp_content: Dict[str, Any]) -> List[str]:
         """Extract implemented control IDs from SSP"""
         controls = []
@@ -520,11 +607,15 @@ class ComplianceChecker:
         
         return priority_actions[:5]  # Return top 5 priorities
     
+    def _current_timestamp(self) -> str:
+        """UTC time of the check in ISO 8601 form, taken per report rather than per checker"""
+        return datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
+    
     def _create_error_result(self, error_message: str) -> Dict[str, Any]:
         """Create error result"""
         return {
             "compliance_check": {
-                "timestamp": self.timestamp,
+                "timestamp": self._current_timestamp(),
                 "compliant": False,
                 "compliance_score": 0.0,
                 "error": error_message,
@@ -0,0 +1,59 @@
+"""
+JSON helpers for oscalize
+
+Uses orjson for parsing and writing when it is installed and falls back to the
+standard library json module otherwise. orjson.JSONDecodeError subclasses
+json.JSONDecodeError, so callers can keep catching json.JSONDecodeError.
+"""
+
+import json
+import mmap
+import os
+from pathlib import Path
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Files at least this large are parsed from a memory map instead of a read copy
+_MMAP_THRESHOLD = 64 * 1024
+
+
+def loads(data: Union[bytes, str]) -> Any:
+    """Parse JSON from bytes or str"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def load_file(path: Union[Path, str]) -> Any:
+    """Read and parse a JSON file"""
+    with open(path, 'rb') as f:
+        if orjson is not None and os.fstat(f.fileno()).st_size >= _MMAP_THRESHOLD:
+            # orjson parses straight from the page cache, skipping the copy into bytes
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                with memoryview(mapped) as view:
+                    return orjson.loads(view)
+        return loads(f.read())
+
+
+def dumps(obj: Any) -> bytes:
+    """Serialize to UTF-8 JSON bytes indented by two spaces"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, indent=2, ensure_ascii=False).encode('utf-8')
+
+
+def dumps_compact(obj: Any) -> bytes:
+    """Serialize to UTF-8 JSON bytes without indentation"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+def dump_file(obj: Any, path: Union[Path, str]) -> None:
+    """Serialize and write a JSON file"""
+    with open(path, 'wb') as f:
+        f.write(dumps(obj))
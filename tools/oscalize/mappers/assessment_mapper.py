@@ -6,6 +6,8 @@ Handles Security Assessment Plan and Security Assessment Report conversions.
 """
 
 import logging
+import os
+import re
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
@@ -13,17 +15,49 @@ from .base_mapper import BaseMapper
 
 logger = logging.getLogger(__name__)
 
+_NUMBERED_STEPS_RE = re.compile(r'^\s*\d+\.?\s+(.+?)(?=^\s*\d+\.|\Z)', re.MULTILINE | re.DOTALL)
+_BULLETED_STEPS_RE = re.compile(r'^\s*[•\-\*]\s+(.+?)(?=^\s*[•\-\*]|\Z)', re.MULTILINE | re.DOTALL)
+
+# Assessment method by title keyword, in priority order: the first keyword found
+# in a title decides its method
+_ASSESSMENT_METHOD_TYPES = {
+    "test": "TEST",
+    "examine": "EXAMINE",
+    "interview": "INTERVIEW"
+}
+
+# Section categories and the lowercase title keywords that route a section into
+# each; a section lands in every category it matches
+_SECTION_KEYWORDS = (
+    ("terms", ("terms and conditions", "assumptions", "constraints", "limitations")),
+    ("methods", tuple(_ASSESSMENT_METHOD_TYPES)),
+    ("scope", ("scope", "control")),
+    ("assets", ("tool", "resource", "asset")),
+    ("tasks", ("procedure", "task", "activity")),
+    ("findings", ("finding", "deficiency", "issue")),
+    ("observations", ("observation", "result")),
+)
+
+_SECTION_CATEGORY_BY_KEYWORD = {
+    keyword: category
+    for category, keywords in _SECTION_KEYWORDS
+    for keyword in keywords
+}
+
+# One scan reports every keyword occurrence in a title, including overlapping
+# ones, since the lookahead consumes nothing; no keyword is a prefix of another,
+# so taking one alternative per position loses no match
+_SECTION_KEYWORD_RE = re.compile(
+    "(?=(" + "|".join(re.escape(keyword) for keyword in _SECTION_CATEGORY_BY_KEYWORD) + "))"
+)
+
 
 class AssessmentMapper(BaseMapper):
     """Mapper for assessment documents to OSCAL AP and AR artifacts"""
     
     def __init__(self, mapping_dir: Optional[Path] = None):
         super().__init__(mapping_dir)
-        self.assessment_method_mappings = {
-            "test": "TEST",
-            "examine": "EXAMINE", 
-            "interview": "INTERVIEW"
-        }
+        self.assessment_method_mappings = dict(_ASSESSMENT_METHOD_TYPES)
     
     def map_assessment_plan(self, cir_data: Dict[str, Any]) -> Dict[str, Any]:
         """Map CIR data to OSCAL Assessment Plan"""
@@ -31,22 +65,22 @@ class AssessmentMapper(BaseMapper):
         
         document = cir_data.get("document", {})
         metadata = document.get("metadata", {})
-        sections = document.get("sections", [])
+        sections = self._classify_sections(document.get("sections", []))
         
         # Build Assessment Plan structure
         assessment_plan = {
-            "assessment-plan": {
+            "assessment-plan": self._drop_empty({
                 "uuid": self.generate_uuid(),
                 "metadata": self._build_ap_metadata(metadata),
                 "import-ssp": self._build_import_ssp(),
-                "local-definitions": self._build_ap_local_definitions(sections),
-                "terms-and-conditions": self._build_terms_and_conditions(sections),
-                "reviewed-controls": self._build_reviewed_controls(sections),
-                "assessment-subjects": self._build_assessment_subjects(sections),
-                "assessment-assets": self._build_assessment_assets(sections),
-                "tasks": self._build_assessment_tasks(sections),
+                "local-definitions": self._build_ap_local_definitions(sections["methods"]),
+                "terms-and-conditions": self._build_terms_and_conditions(sections["terms"]),
+                "reviewed-controls": self._build_reviewed_controls(sections["scope"]),
+                "assessment-subjects": self._build_assessment_subjects(),
+                "assessment-assets": self._build_assessment_assets(sections["assets"]),
+                "tasks": self._build_assessment_tasks(sections["tasks"]),
                 "back-matter": self._build_back_matter(metadata)
-            }
+            })
         }
         
         return assessment_plan
@@ -57,22 +91,45 @@ class AssessmentMapper(BaseMapper):
         
         document = cir_data.get("document", {})
         metadata = document.get("metadata", {})
-        sections = document.get("sections", [])
+        sections = self._classify_sections(document.get("sections", []))
         
         # Build Assessment Results structure
         assessment_results = {
-            "assessment-results": {
+            "assessment-results": self._drop_empty({
                 "uuid": self.generate_uuid(),
                 "metadata": self._build_ar_metadata(metadata),
                 "import-ap": self._build_import_ap(),
-                "local-definitions": self._build_ar_local_definitions(sections),
-                "results": self._build_results(sections),
+                "local-definitions": self._build_ar_local_definitions(sections["findings"]),
+                "results": self._build_results(sections["findings"], sections["observations"]),
                 "back-matter": self._build_back_matter(metadata)
-            }
+            })
         }
         
         return assessment_results
     
+    def _drop_empty(self, parts: Dict[str, Any]) -> Dict[str, Any]:
+        """Leave out top-level parts that came back empty
+        
+        OSCAL JSON arrays must hold at least one item, and an empty object carries nothing.
+        """
+        return {key: value for key, value in parts.items() if value not in (None, {}, [])}
+    
+    def _classify_sections(self, sections: List[Dict[str, Any]]) -> Dict[str, List[Dict[str, Any]]]:
+        """Route sections into categories by title keywords in a single pass
+        
+        Each title is lowercased once here rather than once per category helper.
+        """
+        categories = {category: [] for category, _ in _SECTION_KEYWORDS}
+        category_by_keyword = _SECTION_CATEGORY_BY_KEYWORD
+        
+        for section in sections:
+            title_lower = section.get("title", "").lower()
+            matched = {category_by_keyword[keyword] for keyword in _SECTION_KEYWORD_RE.findall(title_lower)}
+            for category in matched:
+                categories[category].append(section)
+        
+        return categories
+    
     def _build_ap_metadata(self, metadata: Dict[str, Any]) -> Dict[str, Any]:
         """Build metadata for Assessment Plan"""
         oscal_metadata = self.create_oscal_metadata(
@@ -123,12 +180,12 @@ class AssessmentMapper(BaseMapper):
             "description": "Reference to the Assessment Plan"
         }
     
-    def _build_ap_local_definitions(self, sections: List[Dict[str, Any]]) -> Dict[str, Any]:
+    def _build_ap_local_definitions(self, method_sections: List[Dict[str, Any]]) -> Dict[str, Any]:
         """Build local definitions for Assessment Plan"""
         local_definitions = {}
         
         # Extract assessment methods from sections
-        methods = self._extract_assessment_methods(sections)
+        methods = self._extract_assessment_methods(method_sections)
         if methods:
             local_definitions["activities"] = []
             for method_name, method_data in methods.items():
@@ -155,33 +212,30 @@ class AssessmentMapper(BaseMapper):
         
         return local_definitions
     
-    def _build_ar_local_definitions(self, sections: List[Dict[str, Any]]) -> Dict[str, Any]:
+    def _build_ar_local_definitions(self, finding_sections: List[Dict[str, Any]]) -> Dict[str, Any]:
         """Build local definitions for Assessment Results"""
         local_definitions = {}
         
         # Extract findings from sections
-        findings_data = self._extract_findings(sections)
+        findings_data = self._extract_findings(finding_sections)
         if findings_data:
             local_definitions["findings"] = findings_data
         
         return local_definitions
     
-    def _build_terms_and_conditions(self, sections: List[Dict[str, Any]]) -> Dict[str, Any]:
+    def _build_terms_and_conditions(self, terms_sections: List[Dict[str, Any]]) -> Dict[str, Any]:
         """Build terms and conditions section"""
-        # Find terms and conditions text
-        terms_text = self._extract_section_text(
-            sections, 
-            ["terms and conditions", "assumptions", "constraints", "limitations"]
-        )
+        # Take the text of the first terms and conditions section
+        terms_text = terms_sections[0].get("text", "") if terms_sections else None
         
         return {
             "description": terms_text or "Terms and conditions not specified in source document."
         }
     
-    def _build_reviewed_controls(self, sections: List[Dict[str, Any]]) -> Dict[str, Any]:
+    def _build_reviewed_controls(self, scope_sections: List[Dict[str, Any]]) -> Dict[str, Any]:
         """Build reviewed controls section"""
         # Extract control scope from sections
-        control_scope = self._extract_control_scope(sections)
+        control_scope = self._extract_control_scope(scope_sections)
         
         return {
             "description": "Controls to be reviewed during assessment",
@@ -191,12 +245,12 @@ class AssessmentMapper(BaseMapper):
             "control-selections": control_scope.get("selections", [])
         }
     
-    def _build_assessment_subjects(self, sections: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    def _build_assessment_subjects(self) -> List[Dict[str, Any]]:
         """Build assessment subjects"""
         subjects = []
         
-        # Extract subjects from sections
-        subject_info = self._extract_subjects(sections)
+        # Extract subjects
+        subject_info = self._extract_subjects()
         
         for subject_data in subject_info:
             subject = {
@@ -214,12 +268,12 @@ class AssessmentMapper(BaseMapper):
         
         return subjects
     
-    def _build_assessment_assets(self, sections: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    def _build_assessment_assets(self, asset_sections: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Build assessment assets"""
         assets = []
         
         # Extract assessment tools and resources
-        asset_info = self._extract_assessment_assets(sections)
+        asset_info = self._extract_assessment_assets(asset_sections)
         
         for asset_data in asset_info:
             asset = {
@@ -238,12 +292,12 @@ class AssessmentMapper(BaseMapper):
         
         return assets
     
-    def _build_assessment_tasks(self, sections: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    def _build_assessment_tasks(self, task_sections: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Build assessment tasks"""
         tasks = []
         
         # Extract assessment procedures
-        task_info = self._extract_assessment_tasks(sections)
+        task_info = self._extract_assessment_tasks(task_sections)
         
         for task_data in task_info:
             task = {
@@ -268,13 +322,14 @@ class AssessmentMapper(BaseMapper):
         
         return tasks
     
-    def _build_results(self, sections: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    def _build_results(self, finding_sections: List[Dict[str, Any]],
+                       observation_sections: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Build assessment results"""
         results = []
         
         # Extract findings and observations
-        findings = self._extract_findings(sections)
-        observations = self._extract_observations(sections)
+        findings = self._extract_findings(finding_sections)
+        observations = self._extract_observations(observation_sections)
         
         # Create result entry
         result = {
@@ -301,7 +356,7 @@ class AssessmentMapper(BaseMapper):
         source_file = metadata.get("source_file")
         if source_file:
             resource = self.create_back_matter_resource(
-                title=f"Assessment Source: {Path(source_file).name}",
+                title=f"Assessment Source: {os.path.basename(source_file)}",
                 source_path=source_file,
                 description="Original assessment document used for OSCAL generation"
             )
@@ -311,56 +366,45 @@ class AssessmentMapper(BaseMapper):
             "resources": resources
         }
     
-    # Helper methods for extraction
-    
-    def _extract_section_text(self, sections: List[Dict[str, Any]], keywords: List[str]) -> Optional[str]:
-        """Extract text from sections matching keywords"""
-        for section in sections:
-            title_lower = section.get("title", "").lower()
-            for keyword in keywords:
-                if keyword.lower() in title_lower:
-                    return section.get("text", "")
-        return None
+    # Helper methods for extraction; each receives the sections that
+    # _classify_sections routed to its category
     
     def _extract_assessment_methods(self, sections: List[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
         """Extract assessment methods from sections"""
         methods = {}
+        # The same table routed these sections here, so every title names a method
+        method_mappings = _ASSESSMENT_METHOD_TYPES.items()
         
         for section in sections:
             title_lower = section.get("title", "").lower()
             text = section.get("text", "")
             
-            # Look for method keywords
-            if any(method in title_lower for method in ["test", "examine", "interview"]):
-                method_type = None
-                if "test" in title_lower:
-                    method_type = "TEST"
-                elif "examine" in title_lower:
-                    method_type = "EXAMINE"
-                elif "interview" in title_lower:
-                    method_type = "INTERVIEW"
-                
-                if method_type and method_type not in methods:
-                    methods[method_type] = {
-                        "title": section.get("title", ""),
-                        "description": text,
-                        "steps": self._extract_steps(text)
-                    }
+            # First method keyword in mapping order wins, so "test" outranks the others
+            method_type = next(
+                (method for keyword, method in method_mappings if keyword in title_lower),
+                None
+            )
+            
+            if method_type and method_type not in methods:
+                methods[method_type] = {
+                    "title": section.get("title", ""),
+                    "description": text,
+                    "steps": self._extract_steps(text)
+                }
         
         return methods
     
     def _extract_steps(self, text: str) -> List[str]:
         """Extract procedure steps from text"""
         # Simple extraction of numbered or bulleted lists
-        import re
         
         # Look for numbered steps
-        numbered_steps = re.findall(r'^\s*\d+\.?\s+(.+?)(?=^\s*\d+\.|\Z)', text, re.MULTILINE | re.DOTALL)
+        numbered_steps = _NUMBERED_STEPS_RE.findall(text)
         if numbered_steps:
             return [step.strip() for step in numbered_steps]
         
         # Look for bulleted steps
-        bulleted_steps = re.findall(r'^\s*[•\-\*]\s+(.+?)(?=^\s*[•\-\*]|\Z)', text, re.MULTILINE | re.DOTALL)
+        bulleted_steps = _BULLETED_STEPS_RE.findall(text)
         if bulleted_steps:
             return [step.strip() for step in bulleted_steps]
         
@@ -372,19 +416,17 @@ class AssessmentMapper(BaseMapper):
         scope_data = {"scope": "full", "selections": []}
         
         for section in sections:
-            title_lower = section.get("title", "").lower()
-            if "scope" in title_lower or "control" in title_lower:
-                # Simple scope extraction
-                text = section.get("text", "").lower()
-                if "all controls" in text or "complete" in text:
-                    scope_data["scope"] = "full"
-                elif "selected" in text or "subset" in text:
-                    scope_data["scope"] = "selective"
+            # Simple scope extraction
+            text = section.get("text", "").lower()
+            if "all controls" in text or "complete" in text:
+                scope_data["scope"] = "full"
+            elif "selected" in text or "subset" in text:
+                scope_data["scope"] = "selective"
         
         return scope_data
     
-    def _extract_subjects(self, sections: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-        """Extract assessment subjects from sections"""
+    def _extract_subjects(self) -> List[Dict[str, Any]]:
+        """Extract assessment subjects"""
         subjects = []
         
         # Default subject for system-wide assessment
@@ -402,13 +444,12 @@ class AssessmentMapper(BaseMapper):
         assets = []
         
         for section in sections:
-            title_lower = section.get("title", "").lower()
-            if "tool" in title_lower or "resource" in title_lower or "asset" in title_lower:
-                assets.append({
-                    "title": section.get("title", ""),
-                    "description": section.get("text", "")[:200] + "..." if len(section.get("text", "")) > 200 else section.get("text", ""),
-                    "asset_type": "tool"
-                })
+            text = section.get("text", "")
+            assets.append({
+                "title": section.get("title", ""),
+                "description": text[:200] + "..." if len(text) > 200 else text,
+                "asset_type": "tool"
+            })
         
         return assets
     
@@ -417,15 +458,13 @@ class AssessmentMapper(BaseMapper):
         tasks = []
         
         for section in sections:
-            title_lower = section.get("title", "").lower()
-            if "procedure" in title_lower or "task" in title_lower or "activity" in title_lower:
-                tasks.append({
-                    "title": section.get("title", ""),
-                    "description": section.get("text", ""),
-                    "timing": {"period": {"start": self.timestamp}},
-                    "dependencies": [],
-                    "associated_activities": []
-                })
+            tasks.append({
+                "title": section.get("title", ""),
+                "description": section.get("text", ""),
+                "timing": {"period": {"start": self.timestamp}},
+                "dependencies": [],
+                "associated_activities": []
+            })
         
         return tasks
     
@@ -434,17 +473,15 @@ class AssessmentMapper(BaseMapper):
         findings = []
         
         for section in sections:
-            title_lower = section.get("title", "").lower()
-            if "finding" in title_lower or "deficiency" in title_lower or "issue" in title_lower:
-                finding = {
-                    "uuid": self.generate_uuid(),
-                    "title": section.get("title", ""),
-                    "description": section.get("text", ""),
-                    "props": [
-                        self.create_property("finding-type", "deficiency")
-                    ]
-                }
-                findings.append(finding)
+            finding = {
+                "uuid": self.generate_uuid(),
+                "title": section.get("title", ""),
+                "description": section.get("text", ""),
+                "props": [
+                    self.create_property("finding-type", "deficiency")
+                ]
+            }
+            findings.append(finding)
         
         return findings
     
@@ -453,15 +490,13 @@ class AssessmentMapper(BaseMapper):
         observations = []
         
         for section in sections:
-            title_lower = section.get("title", "").lower()
-            if "observation" in title_lower or "result" in title_lower:
-                observation = {
-                    "uuid": self.generate_uuid(),
-                    "title": section.get("title", ""),
-                    "description": section.get("text", ""),
-                    "methods": ["EXAMINE"],  # Default method
-                    "types": ["finding"]
-                }
-                observations.append(observation)
+            observation = {
+                "uuid": self.generate_uuid(),
+                "title": section.get("title", ""),
+                "description": section.get("text", ""),
+                "methods": ["EXAMINE"],  # Default method
+                "types": ["finding"]
+            }
+            observations.append(observation)
         
         return observations
\ No newline at end of file
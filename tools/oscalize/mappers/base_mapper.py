@@ -4,11 +4,55 @@ Base mapper class for OSCAL conversions
 Provides common functionality for all CIR to OSCAL mappers.
 """
 
-import uuid
+import os
+import threading
 from abc import ABC, abstractmethod
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
+
+from ..jsonio import load_file
+
+# Parsed mapping configs by absolute path, with the (mtime_ns, size) they were read
+# at, so repeated mapper construction reuses them until the file changes. SSPMapper
+# loads its configs in __init__, and corpus runs build one SSPMapper per document.
+_MAPPING_CONFIG_CACHE: Dict[str, Tuple[Tuple[int, int], Dict[str, Any]]] = {}
+
+# Random UUIDs are cut from one os.urandom read per batch rather than a read each
+_UUID_BATCH_SIZE = 1024
+_uuid_pool: List[str] = []
+# Guards the pool so mappers stay safe to call from several threads
+_uuid_pool_lock = threading.Lock()
+
+
+def _reset_uuid_pool_in_child() -> None:
+    """Empty the pool and replace its lock in a freshly forked child
+    
+    The child must not hand out UUIDs its parent may also still hold, and the
+    lock may have been held by a parent thread that does not exist in the child.
+    """
+    global _uuid_pool_lock
+    _uuid_pool_lock = threading.Lock()
+    _uuid_pool.clear()
+
+
+os.register_at_fork(after_in_child=_reset_uuid_pool_in_child)
+
+
+def _refill_uuid_pool() -> None:
+    """Add a batch of version 4 UUID strings to the pool"""
+    raw = bytearray(os.urandom(16 * _UUID_BATCH_SIZE))
+    
+    # Set the version and RFC 4122 variant bits exactly as uuid.uuid4() does
+    raw[6::16] = bytes((octet & 0x0F) | 0x40 for octet in raw[6::16])
+    raw[8::16] = bytes((octet & 0x3F) | 0x80 for octet in raw[8::16])
+    
+    digits = raw.hex()
+    _uuid_pool.extend(
+        f"{digits[i:i + 8]}-{digits[i + 8:i + 12]}-{digits[i + 12:i + 16]}-"
+        f"{digits[i + 16:i + 20]}-{digits[i + 20:i + 32]}"
+        for i in range(0, len(digits), 32)
+    )
 
 
 class BaseMapper(ABC):
@@ -22,7 +66,10 @@ class BaseMapper(ABC):
     
     def generate_uuid(self) -> str:
         """Generate UUID for OSCAL objects"""
-        return str(uuid.uuid4())
+        with _uuid_pool_lock:
+            if not _uuid_pool:
+                _refill_uuid_pool()
+            return _uuid_pool.pop()
     
     def create_oscal_metadata(self, title: str, **kwargs) -> Dict[str, Any]:
         """Create OSCAL metadata section"""
@@ -124,7 +171,7 @@ class BaseMapper(ABC):
         """Extract source citation information for back-matter"""
         citation = {
             "uuid": self.generate_uuid(),
-            "title": f"Source: {Path(source['file']).name}",
+            "title": f"Source: {os.path.basename(source['file'])}",
             "props": [
                 self.create_property("source-file", source["file"]),
                 self.create_property("extraction-timestamp", self.timestamp)
@@ -173,12 +220,24 @@ class BaseMapper(ABC):
         pass
     
     def _load_mapping_config(self, config_name: str) -> Dict[str, Any]:
-        """Load mapping configuration file"""
-        config_path = self.mapping_dir / f"{config_name}.json"
+        """Load mapping configuration file
+        
+        Configs are shared between mapper instances and must be treated as read-only.
+        """
+        # A relative mapping_dir names different files once the working directory changes
+        config_path = os.path.abspath(self.mapping_dir / f"{config_name}.json")
+        
+        try:
+            stat = os.stat(config_path)
+        except OSError:
+            return {}  # Return empty config if file doesn't exist
+        
+        signature = (stat.st_mtime_ns, stat.st_size)
+        cached = _MAPPING_CONFIG_CACHE.get(config_path)
+        if cached is not None and cached[0] == signature:
+            return cached[1]
         
-        if config_path.exists():
-            import json
-            with open(config_path, 'r') as f:
-                return json.load(f)
+        config = load_file(config_path)
         
-        return {}  # Return empty config if file doesn't exist
\ No newline at end of file
+        _MAPPING_CONFIG_CACHE[config_path] = (signature, config)
+        return config
\ No newline at end of file
@@ -6,6 +6,7 @@ Integrates with SSP system-implementation section.
 """
 
 import logging
+import os
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
@@ -268,7 +269,7 @@ class InventoryMapper(BaseMapper):
         source_file = metadata.get("source_file")
         if source_file:
             resource = self.create_back_matter_resource(
-                title=f"Inventory Source: {Path(source_file).name}",
+                title=f"Inventory Source: {os.path.basename(source_file)}",
                 source_path=source_file,
                 description="Original inventory spreadsheet used for component generation"
             )
@@ -6,6 +6,7 @@ Complies with FedRAMP POA&M v3.0 requirements and structure.
 """
 
 import logging
+import os
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, List, Optional
@@ -289,7 +290,7 @@ class POAMMapper(BaseMapper):
         source_file = metadata.get("source_file")
         if source_file:
             resource = self.create_back_matter_resource(
-                title=f"POA&M Source: {Path(source_file).name}",
+                title=f"POA&M Source: {os.path.basename(source_file)}",
                 source_path=source_file,
                 description="Original POA&M spreadsheet used for OSCAL generation"
             )
@@ -6,6 +6,7 @@ Maps system characteristics, FIPS-199 categorization, and control implementation
 """
 
 import logging
+import os
 import re
 from pathlib import Path
 from typing import Any, Dict, List, Optional
@@ -521,7 +522,7 @@ class SSPMapper(BaseMapper):
                 
                 if source_file:
                     resource = self.create_back_matter_resource(
-                        title=f"Source {data_type.title()}: {Path(source_file).name}",
+                        title=f"Source {data_type.title()}: {os.path.basename(source_file)}",
                         source_path=source_file,
                         description=f"Original {data_type} file used for OSCAL generation"
                     )
@@ -8,21 +8,31 @@ import json
 import logging
 import tarfile
 import tempfile
+from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional
+
+try:
+    import pyzstd
+except ImportError:
+    pyzstd = None
 
 from .manifest_generator import ManifestGenerator
 
 logger = logging.getLogger(__name__)
 
+# tarfile cannot detect zstd on its own, so bundles are sniffed for this frame magic
+_ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+_ZSTD_LEVEL = 3
+
 
 class BundleCreator:
     """Creator for OSCAL artifact bundles"""
     
-    def __init__(self):
+    def __init__(self, jobs: Optional[int] = None):
         self.timestamp = datetime.utcnow().isoformat() + "Z"
-        self.manifest_generator = ManifestGenerator()
+        self.manifest_generator = ManifestGenerator(jobs=jobs)
         
     def create_bundle(self, source_dir: Path, output_file: Path, 
                      include_patterns: Optional[List[str]] = None,
@@ -33,6 +43,9 @@ class BundleCreator:
         if not source_dir.exists():
             raise ValueError(f"Source directory not found: {source_dir}")
         
+        if compression == "zst" and pyzstd is None:
+            raise ValueError("zstd compression requires the pyzstd package")
+        
         # Ensure output directory exists
         output_file.parent.mkdir(parents=True, exist_ok=True)
         
@@ -248,6 +261,22 @@ Generated by oscalize - LLM-free local OSCAL converter
     def _create_compressed_bundle(self, bundle_dir: Path, output_file: Path, 
                                  compression: str) -> None:
         """Create compressed tar bundle"""
+        if compression == "zst":
+            # Much faster than gzip at a similar ratio on JSON artifacts; libzstd
+            # can also compress on worker threads
+            level_or_option = _ZSTD_LEVEL
+            workers = self.manifest_generator.jobs
+            if workers > 1 and pyzstd.zstd_support_multithread:
+                level_or_option = {
+                    pyzstd.CParameter.compressionLevel: _ZSTD_LEVEL,
+                    pyzstd.CParameter.nbWorkers: workers
+                }
+            
+            with pyzstd.ZstdFile(output_file, "wb", level_or_option=level_or_option) as zst:
+                with tarfile.open(fileobj=zst, mode="w") as tar:
+                    tar.add(bundle_dir, arcname="oscal-bundle")
+            return
+        
         # Determine compression mode
         if compression == "gz":
             mode = "w:gz"
@@ -262,6 +291,24 @@ Generated by oscalize - LLM-free local OSCAL converter
             # Add all files in bundle directory
             tar.add(bundle_dir, arcname="oscal-bundle")
     
+    @contextmanager
+    def _open_bundle(self, bundle_file: Path) -> Iterator[tarfile.TarFile]:
+        """Open bundle for reading, whatever its compression"""
+        with open(bundle_file, 'rb') as f:
+            is_zstd = f.read(len(_ZSTD_MAGIC)) == _ZSTD_MAGIC
+        
+        if not is_zstd:
+            with tarfile.open(bundle_file, 'r:*') as tar:
+                yield tar
+            return
+        
+        if pyzstd is None:
+            raise ValueError(f"Bundle {bundle_file} is zstd-compressed; install pyzstd to read it")
+        
+        with pyzstd.ZstdFile(bundle_file, 'rb') as zst:
+            with tarfile.open(fileobj=zst, mode='r:') as tar:
+                yield tar
+    
     def extract_bundle(self, bundle_file: Path, extract_dir: Path) -> Dict[str, Any]:
         """Extract bundle and return metadata"""
         logger.info(f"Extracting bundle {bundle_file} to {extract_dir}")
@@ -271,9 +318,10 @@ Generated by oscalize - LLM-free local OSCAL converter
         
         extract_dir.mkdir(parents=True, exist_ok=True)
         
-        # Extract tar bundle
-        with tarfile.open(bundle_file, 'r:*') as tar:
-            tar.extractall(extract_dir)
+        # Extract tar bundle; the "data" filter rejects absolute paths, links
+        # outside extract_dir and device files, and skips per-member chown/chmod
+        with self._open_bundle(bundle_file) as tar:
+            tar.extractall(extract_dir, filter="data")
         
         # Look for bundle metadata
         bundle_root = extract_dir / "oscal-bundle"
@@ -307,7 +355,7 @@ Generated by oscalize - LLM-free local OSCAL converter
         
         contents = []
         
-        with tarfile.open(bundle_file, 'r:*') as tar:
+        with self._open_bundle(bundle_file) as tar:
             for member in tar.getmembers():
                 if member.isfile():
                     contents.append({
@@ -329,7 +377,7 @@ Generated by oscalize - LLM-free local OSCAL converter
         try:
             # Extract just the manifest
             with tempfile.TemporaryDirectory() as temp_dir:
-                with tarfile.open(bundle_file, 'r:*') as tar:
+                with self._open_bundle(bundle_file) as tar:
                     # Find manifest file
                     manifest_member = None
                     for member in tar.getmembers():
@@ -341,7 +389,7 @@ Generated by oscalize - LLM-free local OSCAL converter
                         return {"valid": False, "error": "Manifest not found in bundle"}
                     
                     # Extract and verify manifest
-                    tar.extract(manifest_member, temp_dir)
+                    tar.extract(manifest_member, temp_dir, filter="data")
                     manifest_path = Path(temp_dir) / manifest_member.name
                     
                     # Note: Full verification would require extracting all files
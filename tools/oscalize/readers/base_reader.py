@@ -25,11 +25,8 @@ class BaseReader(ABC):
     
     def _calculate_file_hash(self) -> str:
         """Calculate SHA-256 hash of input file"""
-        hasher = hashlib.sha256()
         with open(self.file_path, 'rb') as f:
-            for chunk in iter(lambda: f.read(4096), b""):
-                hasher.update(chunk)
-        return hasher.hexdigest()
+            return hashlib.file_digest(f, "sha256").hexdigest()
     
     def _create_source_reference(self, **kwargs) -> Dict[str, Any]:
         """Create source reference for auditability"""
@@ -7,11 +7,11 @@ Maintains source attribution for all sections and content.
 
 import json
 import subprocess
-import tempfile
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 import logging
 
+from ..jsonio import loads
 from .base_reader import BaseReader
 
 logger = logging.getLogger(__name__)
@@ -73,32 +73,22 @@ class DocumentReader(BaseReader):
     def _convert_to_pandoc_json(self) -> Dict[str, Any]:
         """Convert document to Pandoc JSON AST"""
         try:
-            # Use temporary file for Pandoc JSON output
-            with tempfile.NamedTemporaryFile(mode='w+', suffix='.json', delete=False) as temp_file:
-                temp_path = Path(temp_file.name)
-            
-            # Convert document to Pandoc JSON
+            # Convert document to Pandoc JSON; the AST is read from stdout rather
+            # than written to and read back from a temporary file
             cmd = [
                 'pandoc',
                 str(self.file_path),
-                '--to', 'json',
-                '--output', str(temp_path)
+                '--to', 'json'
             ]
             
             if self.source_type == 'docx':
                 # Extract embedded media for DOCX
                 cmd.extend(['--extract-media', str(self.file_path.parent / 'media')])
             
-            subprocess.run(cmd, check=True, capture_output=True)
-            
-            # Read the JSON AST
-            with open(temp_path, 'r', encoding='utf-8') as f:
-                pandoc_json = json.load(f)
-            
-            # Clean up temporary file
-            temp_path.unlink()
+            result = subprocess.run(cmd, check=True, capture_output=True)
             
-            return pandoc_json
+            # Parse the JSON AST straight from the captured bytes
+            return loads(result.stdout)
             
         except subprocess.CalledProcessError as e:
             raise RuntimeError(f"Pandoc conversion failed: {e.stderr.decode()}")
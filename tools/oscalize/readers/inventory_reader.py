@@ -57,15 +57,21 @@ class InventoryReader(BaseReader):
         """Convert Inventory Excel file to CIR format"""
         logger.info(f"Converting Inventory Excel file: {self.file_path}")
         
-        # Load workbook to detect sheet structure
-        self.workbook = load_workbook(self.file_path, data_only=True)
-        self.sheet_name = self._find_inventory_sheet()
-        
-        if not self.sheet_name:
-            raise ValueError("No inventory sheet found in workbook")
-        
-        # Read data using pandas
-        df = pd.read_excel(self.file_path, sheet_name=self.sheet_name)
+        # Load workbook to detect sheet structure; read-only mode lists sheets
+        # without parsing them, and pandas reads the chosen sheet from the same
+        # workbook instead of opening the file a second time
+        self.workbook = load_workbook(self.file_path, read_only=True, data_only=True, keep_links=False)
+        try:
+            self.sheet_name = self._find_inventory_sheet()
+            
+            if not self.sheet_name:
+                raise ValueError("No inventory sheet found in workbook")
+            
+            # Read data using pandas
+            df = pd.read_excel(self.workbook, sheet_name=self.sheet_name, engine="openpyxl")
+        finally:
+            # Read-only workbooks hold the file open until closed
+            self.workbook.close()
         
         # Detect template version
         template_version = self._detect_template_version(df)
@@ -21,6 +21,7 @@ try:
     from ..readers import DocumentReader, POAMReader, InventoryReader
     from ..mappers import SSPMapper, POAMMapper
     from ..validation import ValidationPipeline
+    from ..jsonio import dump_file
 except ImportError:
     # Fallback for direct execution
     pass
@@ -123,8 +124,7 @@ class EnhancedCorpusTester:
             # Save OSCAL artifacts as expected outputs
             for artifact_type, artifact_data in conversion_results.get("oscal_artifacts", {}).items():
                 output_file = outputs_dir / f"{artifact_type}.json"
-                with open(output_file, 'w') as f:
-                    json.dump(artifact_data, f, indent=2, ensure_ascii=False)
+                dump_file(artifact_data, output_file)
                 logger.info(f"Saved expected output: {output_file.name}")
             
             # Run validation and save results
@@ -365,8 +365,7 @@ class EnhancedCorpusTester:
             actual_outputs = {}
             for artifact_type, artifact_data in conversion_result.get("oscal_artifacts", {}).items():
                 output_file = test_work_dir / f"{artifact_type}.json"
-                with open(output_file, 'w') as f:
-                    json.dump(artifact_data, f, indent=2, ensure_ascii=False)
+                dump_file(artifact_data, output_file)
                 actual_outputs[artifact_type] = artifact_data
             
             # Compare with expected outputs
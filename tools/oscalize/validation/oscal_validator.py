@@ -11,6 +11,8 @@ import tempfile
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
+from ..jsonio import dumps
+
 logger = logging.getLogger(__name__)
 
 # Timeout constants (in seconds)
@@ -75,12 +77,15 @@ class OSCALValidator:
     
     def validate_content(self, content: Dict[str, Any], file_type: str = "json") -> Dict[str, Any]:
         """Validate OSCAL content using temporary file"""
-        with tempfile.NamedTemporaryFile(mode='w', suffix=f'.{file_type}', delete=False) as temp_file:
+        with tempfile.NamedTemporaryFile(mode='wb', suffix=f'.{file_type}', delete=False) as temp_file:
             try:
                 if file_type == "json":
-                    json.dump(content, temp_file, indent=2)
+                    temp_file.write(dumps(content))
                 else:
-                    temp_file.write(str(content))
+                    temp_file.write(str(content).encode('utf-8'))
+                
+                # oscal-cli reads the file while it is still open here
+                temp_file.flush()
                 
                 temp_path = Path(temp_file.name)
                 result = self.validate_file(temp_path)